@@ -0,0 +1,193 @@
+"""대시보드 캐시 사전 계산(warm-up).
+
+@st.cache_data는 처음 호출될 때만 채워지므로, 배포/재시작 직후 첫 방문자가
+데이터 로드와 모든 탭의 집계·차트 생성 비용을 한꺼번에 치르게 됩니다.
+이 모듈은 같은 캐시 함수를 미리 호출해 그 비용을 앞당깁니다.
+
+- 앱: streamlit_app.py가 import 시 start_background_warmup()을 호출하면
+  서버 프로세스당 한 번 백그라운드 스레드에서 실행됩니다 (접속은 바로 받음).
+- CLI: 항목별 소요 시간을 확인할 때 사용합니다 (이 프로세스의 캐시만 채움).
+- 배포 후 hook (--url): 실행 중인 서버에 headless 세션을 열어 스크립트를 끝까지
+  실행합니다. 서버 프로세스의 데이터 로드와 warm-up 스레드가 첫 방문자 전에 끝나므로,
+  배포 직후 이 명령을 실행해야 첫 방문자도 캐시된 화면을 받습니다.
+
+    $ python cache_warmer.py                # 데이터 + 집계 + 기본 차트
+    $ python cache_warmer.py --all-regions  # 17개 지역 상세 분석까지
+    $ python cache_warmer.py --url http://localhost:8501          # 배포 후 hook
+    $ python cache_warmer.py --url http://localhost:8501 --tabs   # 모든 탭까지
+    $ python cache_warmer.py --url http://localhost:8501 --all-regions  # 지역 상세 분석까지
+
+환경 변수
+    NEET_WARMUP=0          앱에서 warm-up 끄기
+    NEET_WARMUP_REGIONS=1  앱에서 지역 상세 분석까지 미리 계산
+"""
+import argparse
+import asyncio
+import logging
+import os
+import re
+import sys
+import threading
+import time
+
+import neet_analysis as na
+
+logger = logging.getLogger("neet.warmup")
+
+_started = False
+_start_lock = threading.Lock()
+
+
+def warmup_tasks(include_regions=False, scope=None):
+    """(이름, 인자 없는 함수) 목록. 앞쪽 항목의 결과를 뒤쪽 항목이 캐시에서 재사용합니다.
+
+    scope를 생략하면 앱의 기본 화면(최신 코호트, 전체 지역)을 미리 계산합니다.
+    """
+    # plotly는 무거우므로 앱 import 시점이 아니라 warm-up 스레드 안에서 로드
+    import neet_charts as charts
+
+    scope = scope or na.default_scope()
+    data_builds = {
+        'load_data': na.load_data,
+        'region_table': na.region_table,
+        'map_points': na.map_points,
+        'outcome_means': na.outcome_means,
+        'asset_group_rates': na.asset_group_rates,
+    }
+    tasks = [(f'data:{name}', lambda build=build: build(scope)) for name, build in data_builds.items()]
+    tasks += [
+        (f'figure:{name}', lambda build=build: build(scope))
+        for name, build in charts.DEFAULT_FIGURES.items()
+    ]
+    tasks.append(('model:fitted_model', lambda: _fit_model(scope.cohort)))
+
+    if include_regions:
+        for region in na.REGIONS:
+            tasks += [
+                (f'region:{region}:report', lambda r=region: na.region_report(scope.cohort, r)),
+                (f'region:{region}:pie', lambda r=region: charts.region_pie_figure(scope.cohort, r)),
+                (f'region:{region}:radar', lambda r=region: charts.region_radar_figure(scope.cohort, r)),
+            ]
+    return tasks
+
+
+def _fit_model(cohort):
+    import neet_model as nm
+
+    return nm.fitted_model(cohort, na.data_version(cohort))
+
+
+def warm_up(include_regions=False):
+    """모든 항목을 순서대로 계산하고 {이름: 소요 시간(초)}을 돌려줍니다.
+
+    한 항목이 실패해도(예: 데이터에 컬럼이 없음) 나머지는 계속 진행합니다.
+    """
+    timings = {}
+    total_start = time.perf_counter()
+
+    for name, build in warmup_tasks(include_regions):
+        start = time.perf_counter()
+        try:
+            build()
+        except Exception:
+            logger.exception("warm-up 실패: %s", name)
+            continue
+        timings[name] = time.perf_counter() - start
+        logger.info("%-48s %8.1f ms", name, timings[name] * 1000)
+
+    logger.info("warm-up 완료: %d개 항목, 총 %.2f s", len(timings), time.perf_counter() - total_start)
+    return timings
+
+
+def start_background_warmup(include_regions=None):
+    """warm-up 스레드를 프로세스당 한 번만 시작. 이미 시작했거나 꺼져 있으면 None"""
+    global _started
+
+    if os.environ.get("NEET_WARMUP", "1") == "0":
+        return None
+    if include_regions is None:
+        include_regions = os.environ.get("NEET_WARMUP_REGIONS") == "1"
+
+    with _start_lock:
+        if _started:
+            return None
+        _started = True
+
+    # Streamlit은 자체 로거만 설정하므로, 타이밍 로그가 보이도록 핸들러를 붙입니다.
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(asctime)s %(name)s: %(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+
+    thread = threading.Thread(
+        target=warm_up, args=(include_regions,), name="neet-cache-warmup", daemon=True
+    )
+    thread.start()
+    return thread
+
+
+# -----------------------------------------------------------------------------
+# 배포 후 hook: 실행 중인 서버에 headless 세션 열기
+# -----------------------------------------------------------------------------
+async def _run_remote_session(ws_url, query_string):
+    """웹소켓으로 세션 하나를 열고 스크립트 실행이 끝날 때까지 기다립니다."""
+    # protobuf 메시지는 streamlit에 포함, 웹소켓 클라이언트는 websockets 패키지 (requirements.txt)
+    import websockets
+    from streamlit.proto.BackMsg_pb2 import BackMsg
+    from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+    async with websockets.connect(ws_url, subprotocols=["streamlit"], max_size=None) as conn:
+        rerun = BackMsg()
+        rerun.rerun_script.SetInParent()
+        rerun.rerun_script.query_string = query_string
+        await conn.send(rerun.SerializeToString())
+
+        async for raw in conn:
+            msg = ForwardMsg()
+            msg.ParseFromString(raw)
+            if msg.WhichOneof("type") == "script_finished":
+                return
+    raise ConnectionError("서버가 세션 연결을 닫았습니다.")
+
+
+def warm_server(url, query_strings=("",), timeout=300):
+    """url의 서버에서 query_strings 화면을 차례로 한 번씩 실행 → {화면: 소요 시간(초)}
+
+    websockets 패키지가 없으면 ImportError
+    """
+    import websockets  # noqa: F401  (연결 전에 먼저 확인)
+
+    ws_url = re.sub(r"^http", "ws", url.rstrip("/")) + "/_stcore/stream"
+    timings = {}
+    for query_string in query_strings:
+        start = time.perf_counter()
+        asyncio.run(asyncio.wait_for(_run_remote_session(ws_url, query_string), timeout))
+        name = query_string or "(기본 화면)"
+        timings[name] = time.perf_counter() - start
+        logger.info("%-48s %8.1f ms", name, timings[name] * 1000)
+    return timings
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="대시보드 캐시 사전 계산 및 항목별 소요 시간 측정")
+    parser.add_argument("--all-regions", action="store_true", help="17개 지역 상세 분석까지 계산")
+    parser.add_argument("--url", help="실행 중인 서버 주소 (배포 후 hook: 서버 프로세스의 캐시를 채움)")
+    parser.add_argument("--tabs", action="store_true", help="--url과 함께: 모든 탭을 한 번씩 실행")
+    parser.add_argument("--timeout", type=float, default=300, help="--url 화면 하나의 제한 시간(초)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    if args.url:
+        query_strings = [""]
+        if args.tabs:
+            from neet_tabs import TABS
+            query_strings += [f"tab={slug}" for slug in TABS.values()]
+        if args.all_regions:
+            query_strings += [f"tab=region_map&region={region}" for region in na.REGIONS]
+        try:
+            warm_server(args.url, query_strings, args.timeout)
+        except ImportError as exc:
+            sys.exit(f"--url에는 웹소켓 클라이언트가 필요합니다: pip install websockets ({exc})")
+    else:
+        warm_up(include_regions=args.all_regions)
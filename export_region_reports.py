@@ -0,0 +1,228 @@
+"""17개 지역 상세 분석 리포트 일괄 내보내기.
+
+지도에서 지역을 하나씩 클릭하는 대신, 모든 지역의 상세 분석(핵심 지표,
+활동경험 파이 차트, 전국 평균 대비 레이더 차트, 인사이트 문장)을 한 번에 만듭니다.
+계산은 앱과 같은 neet_analysis / neet_charts의 build_* 함수를 사용합니다.
+
+    $ python export_region_reports.py                 # exports/regions/<최신 코호트>/ 에 저장
+    $ python export_region_reports.py --cohort YP2021 --workers 4 --force
+
+지역마다 두 파일을 만듭니다.
+- <지역>.html : Plotly 그림(JSON + plotly.js)을 포함해 오프라인에서도 열리는 단일 파일
+- <지역>.json : 지표·분포·레이더 점수·인사이트 데이터
+
+입력(해당 지역 응답 행 + 전국 평균 + 계산 코드)의 지문을 manifest.json에 기록해,
+지난 내보내기 이후 바뀌지 않은 지역은 건너뜁니다.
+"""
+import argparse
+import hashlib
+import html
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pandas as pd
+
+import neet_analysis as na
+
+DEFAULT_OUT_DIR = os.path.join("exports", "regions")
+MANIFEST = "manifest.json"
+
+# 결과에 영향을 주는 코드. 이 파일들이 바뀌면 모든 지역을 다시 만듭니다.
+# (작업 폴더와 관계없이 이 스크립트 옆의 파일을 기준으로)
+_HERE = os.path.dirname(os.path.abspath(__file__))
+CODE_FILES = [
+    os.path.join(_HERE, name)
+    for name in ("neet_analysis.py", "neet_charts.py", "neet_figures.py", "neet_codebook.py",
+                 os.path.basename(__file__))
+]
+
+# 워커 프로세스별 데이터 (initializer에서 한 번만 로드)
+_df = None
+_table = None
+
+
+def load_inputs(cohort):
+    df = na.read_scope(na.make_scope(cohort))
+    return df, na.build_region_table(df)
+
+
+def _init_worker(cohort):
+    global _df, _table
+    _df, _table = load_inputs(cohort)
+
+
+# -----------------------------------------------------------------------------
+# 1. 변경 감지 (지역별 입력 지문)
+# -----------------------------------------------------------------------------
+def code_fingerprint():
+    digest = hashlib.sha256()
+    for path in CODE_FILES:
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def region_fingerprints(df, table):
+    """{지역: 지문}. 지역 응답 행, 전국 평균, 계산 코드 중 하나라도 바뀌면 지문이 바뀝니다."""
+    shared = hashlib.sha256()
+    shared.update(code_fingerprint().encode())
+    shared.update(pd.util.hash_pandas_object(table.mean(numeric_only=True)).values.tobytes())
+
+    row_hashes = pd.util.hash_pandas_object(df, index=False)
+    fingerprints = {}
+    for region in na.REGIONS:
+        digest = shared.copy()
+        digest.update(row_hashes[df['region_label'] == region].values.tobytes())
+        fingerprints[region] = digest.hexdigest()
+    return fingerprints
+
+
+def _read_manifest(out_dir):
+    try:
+        with open(os.path.join(out_dir, MANIFEST), encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _write_manifest(out_dir, manifest):
+    with open(os.path.join(out_dir, MANIFEST), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+
+def _is_current(out_dir, region, fingerprint, manifest):
+    return manifest.get(region) == fingerprint and all(
+        os.path.exists(os.path.join(out_dir, f"{region}.{ext}")) for ext in ("html", "json")
+    )
+
+
+# -----------------------------------------------------------------------------
+# 2. 지역 리포트 생성 (워커 프로세스)
+# -----------------------------------------------------------------------------
+def _markdown_to_html(text):
+    """인사이트 문장의 **굵게**와 문단만 HTML로 바꿉니다."""
+    paragraphs = [p.strip() for p in re.split(r"\n\s*\n", text.strip()) if p.strip()]
+    converted = []
+    for paragraph in paragraphs:
+        body = html.escape(" ".join(line.strip() for line in paragraph.splitlines()))
+        converted.append("<p>" + re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", body) + "</p>")
+    return "\n".join(converted)
+
+
+def report_data(report):
+    """JSON으로 저장할 수 있도록 numpy/pandas 값을 기본 타입으로 변환"""
+    return {
+        'region': report['region'],
+        'metrics': {name: float(value) for name, value in report['metrics'].items()},
+        'exp_counts': {name: int(count) for name, count in report['exp_counts'].items()},
+        'radar': {name: float(score) for name, score in zip(report['categories'], report['radar_r'])},
+        'strong_point': report['strong_point'],
+        'weak_point': report['weak_point'],
+        'insight': na.region_insight_text(report).strip(),
+    }
+
+
+def render_html(report, figures):
+    metrics = "".join(
+        f"<div class='metric'><span>{html.escape(name)}</span><b>{value:g}</b></div>"
+        for name, value in report_data(report)['metrics'].items()
+    )
+    # plotly.js는 첫 그림에만 포함하고 나머지는 재사용
+    charts = "".join(
+        fig.to_html(full_html=False, include_plotlyjs=(i == 0))
+        for i, fig in enumerate(figures)
+    )
+    return f"""<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<title>{html.escape(report['region'])} 지역 상세 분석</title>
+<style>
+  body {{ background: #203A43; color: #ffffff; font-family: 'Pretendard', 'Malgun Gothic', sans-serif; padding: 2rem; }}
+  .metrics {{ display: flex; gap: 12px; flex-wrap: wrap; }}
+  .metric {{ background: rgba(255, 255, 255, 0.1); border: 1px solid rgba(255, 255, 255, 0.2); border-radius: 10px; padding: 15px; }}
+  .metric span {{ display: block; color: #dcdcdc; font-size: 0.9rem; }}
+  .insight {{ background: rgba(0, 0, 0, 0.3); border-radius: 10px; padding: 1rem; }}
+</style>
+</head>
+<body>
+<h1>🔍 [{html.escape(report['region'])}] 지역 상세 분석</h1>
+<div class="metrics">{metrics}</div>
+{charts}
+<div class="insight">{_markdown_to_html(na.region_insight_text(report))}</div>
+</body>
+</html>
+"""
+
+
+def export_region(region, out_dir):
+    """지역 하나의 HTML/JSON을 쓰고 지역 이름을 돌려줍니다."""
+    import neet_charts as charts
+
+    report = na.build_region_report(_df, _table, region)
+    figures = [charts.build_region_pie_figure(report), charts.build_region_radar_figure(report)]
+
+    with open(os.path.join(out_dir, f"{region}.json"), "w", encoding="utf-8") as f:
+        json.dump(report_data(report), f, ensure_ascii=False, indent=2)
+    with open(os.path.join(out_dir, f"{region}.html"), "w", encoding="utf-8") as f:
+        f.write(render_html(report, figures))
+    return region
+
+
+# -----------------------------------------------------------------------------
+# 3. 실행
+# -----------------------------------------------------------------------------
+def export_all(cohort, out_dir, workers=None, force=False):
+    """바뀐 지역만 프로세스 풀로 내보내고 (내보낸 지역, 건너뛴 지역)을 돌려줍니다.
+
+    일부 지역이 실패하면 나머지 지역을 끝내고 manifest를 저장한 뒤 RuntimeError를 냅니다.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    df, table = load_inputs(cohort)
+    regions = [r for r in na.REGIONS if r in set(table['region_label'])]
+
+    fingerprints = region_fingerprints(df, table)
+    manifest = _read_manifest(out_dir)
+    todo = [r for r in regions if force or not _is_current(out_dir, r, fingerprints[r], manifest)]
+    skipped = [r for r in regions if r not in todo]
+
+    done, failed = [], {}
+    if todo:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(cohort,)) as pool:
+            futures = {pool.submit(export_region, region, out_dir): region for region in todo}
+            for future in as_completed(futures):
+                region = futures[future]
+                try:
+                    future.result()
+                except Exception as exc:
+                    failed[region] = exc
+                    manifest.pop(region, None)  # 파일이 일부만 쓰였을 수 있으므로 다음에 다시 생성
+                    continue
+                manifest[region] = fingerprints[region]
+                done.append(region)
+
+    # 실패한 지역이 있어도 끝난 지역의 지문은 남겨 다음 실행에서 다시 만들지 않음
+    _write_manifest(out_dir, manifest)
+    if failed:
+        raise RuntimeError(f"{len(failed)}개 지역 내보내기 실패: {', '.join(failed)}") from next(iter(failed.values()))
+    return done, skipped
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="17개 지역 상세 분석 리포트(HTML/JSON) 일괄 내보내기")
+    parser.add_argument("--cohort", default=None, help="코호트 (기본: 최신)")
+    parser.add_argument("--out", default=None, help=f"출력 폴더 (기본: {DEFAULT_OUT_DIR}/<코호트>)")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--force", action="store_true", help="변경 여부와 관계없이 모두 다시 생성")
+    args = parser.parse_args()
+
+    cohort = args.cohort or na.default_scope().cohort
+    out_dir = args.out or os.path.join(DEFAULT_OUT_DIR, cohort)
+
+    start = time.perf_counter()
+    done, skipped = export_all(cohort, out_dir, args.workers, args.force)
+    print(f"내보내기 완료: {cohort} {len(done)}개 지역 생성, {len(skipped)}개 지역 변경 없음 "
+          f"({time.perf_counter() - start:.1f} s) → {out_dir}")
@@ -0,0 +1,283 @@
+"""동시 접속 부하 테스트.
+
+여러 세션이 동시에 대시보드를 사용하는 상황을 한 대의 Linux 머신에서 오프라인으로
+재현합니다. 세션 하나는 Streamlit AppTest 인스턴스 하나이며, 아래 시나리오를 실행합니다.
+
+    1. 첫 접속 (스크립트 최초 실행)
+    2. 모든 탭 순서대로 전환
+    3. 지도 탭에서 임의 지역 선택 (?region= 쿼리 파라미터, 지도 클릭과 같은 상세 분석)
+    4. 일 경험률 상세 보기 토글 ON
+
+AppTest는 프로세스 전역 상태(Runtime 싱글턴)를 건드리므로 세션은 스레드가 아닌
+고정 크기 프로세스 풀에서 실행합니다. 풀 크기(--concurrency)가 동시 세션 수이고,
+워커 하나가 여러 세션을 차례로 실행하면서 st.cache_data / st.cache_resource
+(공유 결과 캐시 포함)를 서버 프로세스처럼 세션 간에 재사용합니다.
+즉 워커 N개 = 캐시를 따로 가진 서버 N개이며, 서버 하나에 N명이 동시에 붙는 상황과는
+다릅니다 (GIL 경합, 단일 프로세스 메모리는 측정하지 않음).
+
+백그라운드 warm-up(cache_warmer)은 기본으로 끄고(NEET_WARMUP=0) 측정합니다.
+--warmup을 주면 각 워커에서 켭니다.
+
+    $ python load_test.py --sessions 200 --concurrency 8
+    $ python load_test.py --sessions 100 --concurrency 4 --warmup --json result.json
+
+결과: 처리량(steps/s, sessions/s), 단계별 지연 시간 백분위(p50/p90/p95/p99/max),
+워커별 공유 결과 캐시 hit/miss, 일정 간격으로 샘플링한 RSS 추이.
+RSS는 이 프로세스와 모든 워커 RSS의 합(프로세스별 합계)이며 서버 하나의 RSS가 아닙니다.
+"""
+import argparse
+import json
+import math
+import os
+import random
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import neet_analysis as na
+from neet_tabs import TABS
+
+MAP_TAB = "🗺️ 인터랙티브 지도"
+PERCENTILES = (50, 90, 95, 99)
+
+
+# -----------------------------------------------------------------------------
+# 1. 세션 시나리오 (워커 프로세스에서 실행)
+# -----------------------------------------------------------------------------
+def _rss_kb(pid="self"):
+    """/proc/<pid>/status의 VmRSS (kB). 프로세스가 이미 끝났으면 0"""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except (FileNotFoundError, ProcessLookupError):
+        pass
+    return 0
+
+
+def _init_worker(warmup):
+    """워커 환경 고정: warm-up 스레드가 측정에 섞일지 명시적으로 정함"""
+    os.environ["NEET_WARMUP"] = "1" if warmup else "0"
+
+
+def _result_cache_stats():
+    from neet_shared_cache import get_result_cache
+
+    try:
+        return get_result_cache().stats()
+    except Exception:  # 세션이 한 번도 성공하지 못한 경우 등
+        return None
+
+
+def run_session(session_id, app="streamlit_app.py", seed=None, timeout=60):
+    """세션 하나의 시나리오를 실행하고 (단계별 기록 목록, 워커 상태)를 돌려줍니다.
+
+    워커 상태는 세션이 끝난 시점의 (pid, 공유 결과 캐시 통계)입니다.
+    """
+    from streamlit.testing.v1 import AppTest
+
+    rng = random.Random(seed)
+    records = []
+    at = AppTest.from_file(app, default_timeout=timeout)
+
+    def step(name, action):
+        start = time.time()
+        t0 = time.perf_counter()
+        error = None
+        try:
+            action()
+            if at.exception:
+                error = str(at.exception[0].message)
+        except Exception as exc:  # 시간 초과 등도 실패로 집계
+            error = f"{type(exc).__name__}: {exc}"
+        records.append({
+            'session': session_id, 'pid': os.getpid(), 'step': name, 'start': start,
+            'latency': time.perf_counter() - t0, 'error': error,
+        })
+
+    def switch_tab(title):
+        at.radio(key="active_tab").set_value(title).run()
+
+    def select_region(region):
+        at.query_params["region"] = region
+        switch_tab(MAP_TAB)
+
+    def toggle_experience():
+        at.toggle[0].set_value(True).run()
+
+    step("initial_load", at.run)
+    tab_order = list(TABS)
+    rng.shuffle(tab_order)
+    for title in tab_order:
+        step(f"tab:{TABS[title]}", lambda t=title: switch_tab(t))
+    step("map_select", lambda: select_region(rng.choice(na.REGIONS)))
+    step("exp_toggle", toggle_experience)
+    return records, (os.getpid(), _result_cache_stats())
+
+
+# -----------------------------------------------------------------------------
+# 2. RSS 샘플러 (메인 프로세스)
+# -----------------------------------------------------------------------------
+def _child_pids(parent):
+    pids = []
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                # 형식: pid (comm) state ppid ... — comm에 공백이 있을 수 있어 ')' 뒤에서 분리
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (FileNotFoundError, ProcessLookupError, IndexError, ValueError):
+            continue
+        if ppid == parent:
+            pids.append(int(entry))
+    return pids
+
+
+class RssSampler(threading.Thread):
+    """interval초마다 (경과 시간, 워커 수, 총 RSS kB)를 기록"""
+
+    def __init__(self, interval=0.5):
+        super().__init__(name="rss-sampler", daemon=True)
+        self.interval = interval
+        self.samples = []
+        self._stop_event = threading.Event()
+        self._t0 = time.perf_counter()
+
+    def run(self):
+        me = os.getpid()
+        while not self._stop_event.is_set():
+            children = _child_pids(me)
+            total = _rss_kb() + sum(_rss_kb(pid) for pid in children)
+            self.samples.append((time.perf_counter() - self._t0, len(children), total))
+            self._stop_event.wait(self.interval)
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+
+# -----------------------------------------------------------------------------
+# 3. 집계 및 출력
+# -----------------------------------------------------------------------------
+def percentile(sorted_values, pct):
+    """nearest-rank 백분위 (sorted_values는 오름차순)"""
+    if not sorted_values:
+        return float('nan')
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def _requests(cache_stats):
+    return cache_stats['hits'] + cache_stats['misses']
+
+
+def summarize(records, wall, sessions, samples, worker_caches):
+    """worker_caches: {pid: 그 워커의 마지막 공유 결과 캐시 통계}"""
+    by_step = {}
+    for rec in records:
+        by_step.setdefault(rec['step'].split(":")[0], []).append(rec['latency'])
+    by_step['(all)'] = [rec['latency'] for rec in records]
+
+    latency = {}
+    for name, values in by_step.items():
+        values.sort()
+        latency[name] = {f"p{p}": percentile(values, p) for p in PERCENTILES}
+        latency[name]['max'] = values[-1]
+        latency[name]['count'] = len(values)
+
+    return {
+        'sessions': sessions,
+        'steps': len(records),
+        'errors': sum(1 for rec in records if rec['error']),
+        'wall_s': wall,
+        'steps_per_s': len(records) / wall if wall else 0,
+        'sessions_per_s': sessions / wall if wall else 0,
+        'latency_s': latency,
+        'workers': len(worker_caches),
+        'result_cache': {
+            key: sum(stats[key] for stats in worker_caches.values() if stats)
+            for key in ('hits', 'misses', 'evictions')
+        },
+        'rss_kb': [{'t': t, 'workers': n, 'rss_kb': kb} for t, n, kb in samples],
+        'peak_rss_kb': max((kb for _, _, kb in samples), default=0),
+    }
+
+
+def print_report(summary, rss_rows=20):
+    print(f"== {summary['sessions']} sessions, {summary['steps']} steps, "
+          f"{summary['errors']} errors in {summary['wall_s']:.1f} s ==")
+    print(f"throughput: {summary['steps_per_s']:.2f} steps/s, {summary['sessions_per_s']:.2f} sessions/s")
+
+    print("\n== latency (ms) ==")
+    header = "".join(f"{f'p{p}':>9}" for p in PERCENTILES)
+    print(f"{'step':<14}{'count':>7}{header}{'max':>9}")
+    for name, stats in summary['latency_s'].items():
+        cells = "".join(f"{stats[f'p{p}'] * 1000:9.0f}" for p in PERCENTILES)
+        print(f"{name:<14}{stats['count']:>7}{cells}{stats['max'] * 1000:9.0f}")
+
+    cache = summary['result_cache']
+    requests = cache['hits'] + cache['misses']
+    print(f"\n== shared result cache ({summary['workers']} worker processes, each with its own cache) ==")
+    print(f"hits={cache['hits']}  misses={cache['misses']}  evictions={cache['evictions']}  "
+          f"hit_rate={cache['hits'] / requests if requests else 0:.1%}")
+
+    samples = summary['rss_kb']
+    print(f"\n== RSS, sum over this process + worker processes (not a single server), "
+          f"peak {summary['peak_rss_kb'] / 1024:.0f} MiB ==")
+    stride = max(1, len(samples) // rss_rows)
+    for sample in samples[::stride]:
+        print(f"t={sample['t']:7.1f}s  workers={sample['workers']:>4}  rss={sample['rss_kb'] / 1024:8.0f} MiB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="대시보드 동시 세션 부하 테스트 (AppTest + 고정 프로세스 풀)")
+    parser.add_argument("--app", default="streamlit_app.py")
+    parser.add_argument("--sessions", type=int, default=50, help="실행할 세션 총 수")
+    parser.add_argument("--concurrency", type=int, default=None,
+                        help="워커 프로세스 수 = 동시 세션 수 (기본: CPU 수, 최대 --sessions)")
+    parser.add_argument("--timeout", type=float, default=60, help="스크립트 실행 1회 제한 시간(초)")
+    parser.add_argument("--interval", type=float, default=0.5, help="RSS 샘플링 간격(초)")
+    parser.add_argument("--warmup", action="store_true", help="워커에서 백그라운드 warm-up 켜기 (기본: 끔)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="요약과 원본 기록을 저장할 JSON 경로")
+    args = parser.parse_args()
+
+    concurrency = args.concurrency or min(os.cpu_count() or 1, args.sessions)
+    sampler = RssSampler(args.interval)
+    sampler.start()
+
+    records = []
+    worker_caches = {}
+    t0 = time.perf_counter()
+    # AppTest 실행이 워커의 sys.modules["__main__"]을 앱 모듈로 바꿔 두므로, 두 번째 세션부터
+    # __main__.run_session을 찾지 못합니다. 워커가 import할 수 있는 load_test 모듈의 함수를 넘깁니다.
+    import load_test
+
+    with ProcessPoolExecutor(max_workers=concurrency, initializer=load_test._init_worker,
+                             initargs=(args.warmup,)) as pool:
+        futures = [
+            pool.submit(load_test.run_session, i, args.app, args.seed + i, args.timeout)
+            for i in range(args.sessions)
+        ]
+        for future in as_completed(futures):
+            session_records, (pid, cache_stats) = future.result()
+            records.extend(session_records)
+            # 캐시 통계는 누적값이므로 워커별로 요청 수가 가장 많은(마지막) 값을 사용
+            previous = worker_caches.get(pid)
+            if previous is None or (cache_stats and _requests(cache_stats) >= _requests(previous)):
+                worker_caches[pid] = cache_stats
+    wall = time.perf_counter() - t0
+    sampler.stop()
+
+    summary = summarize(records, wall, args.sessions, sampler.samples, worker_caches)
+    print_report(summary)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({'summary': summary, 'records': records}, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""앱의 모든 차트에 대한 생성 시간과 Figure JSON 크기 측정.
+
+    $ python measure_figures.py            # 기본 차트 + 첫 번째 지역 상세 차트
+    $ python measure_figures.py --all-regions
+
+열 설명
+- build_ms      : 차트 생성 시간 (집계 데이터는 미리 계산, 차트 캐시는 비어 있는 상태)
+- json_kb       : st.plotly_chart가 브라우저로 보내는 Figure JSON 크기
+- template_kb   : 그중 layout.template이 차지하는 크기
+- baseline_kb   : 템플릿 도입 전과 같은 방식의 크기. streamlit을 import하면 기본 템플릿이
+                'streamlit'이 되므로, 같은 Figure를 'streamlit' 템플릿 + 예전
+                update_chart_design의 layout 값(neet_figures.THEME_LAYOUT)으로 직렬화
+"""
+import argparse
+import json
+import time
+
+import plotly.graph_objects as go
+import plotly.io as pio
+
+import neet_analysis as na
+import neet_charts as charts
+import neet_figures as nf
+
+# streamlit import 시 등록·기본값이 되는 템플릿 (예전 차트가 실제로 쓰던 템플릿)
+BASELINE_TEMPLATE = "streamlit" if "streamlit" in pio.templates else "plotly"
+
+
+def _kb(text):
+    return len(text.encode("utf-8")) / 1024
+
+
+def measure(name, build):
+    start = time.perf_counter()
+    fig = build()
+    build_ms = (time.perf_counter() - start) * 1000
+
+    payload = pio.to_json(fig, validate=False)
+    template = json.dumps(fig.layout.template.to_plotly_json())
+    # 공유 캐시의 Figure는 수정하면 안 되므로 복사본에 예전 방식(템플릿 교체 + 테마 layout) 적용
+    baseline = go.Figure(fig).update_layout(template=BASELINE_TEMPLATE)
+    baseline.update_layout(**nf.THEME_LAYOUT)
+    return {
+        'chart': name, 'build_ms': build_ms, 'json_kb': _kb(payload),
+        'template_kb': _kb(template), 'baseline_kb': _kb(pio.to_json(baseline, validate=False)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="차트별 생성 시간과 Figure JSON 크기 측정")
+    parser.add_argument("--all-regions", action="store_true", help="17개 지역 상세 차트 모두 측정")
+    args = parser.parse_args()
+
+    # 집계는 미리 계산해 차트 생성 시간만 측정
+    scope = na.default_scope()
+    na.region_table(scope), na.map_points(scope), na.outcome_means(scope), na.asset_group_rates(scope)
+
+    builds = [(name, lambda build=build: build(scope)) for name, build in charts.DEFAULT_FIGURES.items()]
+    for region in (na.REGIONS if args.all_regions else na.REGIONS[:1]):
+        report = na.region_report(scope.cohort, region)
+        builds += [
+            (f'region_pie:{region}', lambda r=report: charts.build_region_pie_figure(r)),
+            (f'region_radar:{region}', lambda r=report: charts.build_region_radar_figure(r)),
+        ]
+
+    rows = [measure(name, build) for name, build in builds]
+
+    print(f"{'chart':<42}{'build_ms':>10}{'json_kb':>10}{'template_kb':>13}{'baseline_kb':>13}")
+    for row in rows:
+        print(f"{row['chart']:<42}{row['build_ms']:10.1f}{row['json_kb']:10.1f}"
+              f"{row['template_kb']:13.1f}{row['baseline_kb']:13.1f}")
+    total = {key: sum(row[key] for row in rows) for key in ('build_ms', 'json_kb', 'template_kb', 'baseline_kb')}
+    print(f"{'(total)':<42}{total['build_ms']:10.1f}{total['json_kb']:10.1f}"
+          f"{total['template_kb']:13.1f}{total['baseline_kb']:13.1f}")
+
+
+if __name__ == "__main__":
+    main()
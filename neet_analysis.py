@@ -0,0 +1,248 @@
+"""청년 NEET 대시보드의 데이터 로드 및 집계 로직.
+
+streamlit_app.py와 cache_warmer.py가 같은 함수를 사용하므로,
+앱 화면과 사전 계산(warm-up) 결과가 항상 같은 캐시 항목을 공유합니다.
+
+- build_* 함수: DataFrame을 받아 결과를 계산하는 순수 함수
+- 나머지 공개 함수: 데이터 범위(DataScope)별로 결과를 보관하는 @st.cache_data 래퍼
+
+데이터는 neet_dataset의 코호트·지역 파티션에서 필요한 부분만 읽습니다.
+파티션이 아직 없으면 기존 단일 CSV(DATA_PATH)를 LEGACY_COHORT로 취급합니다.
+"""
+import os
+from collections import namedtuple
+
+import pandas as pd
+import streamlit as st
+
+import neet_dataset
+from neet_codebook import label_order
+
+DATA_PATH = "neet_dashboard_data.csv"
+LEGACY_COHORT = "YP2021"
+
+# 화면이 보는 데이터 범위: 코호트 하나 + 지역 이름 튜플(None이면 전체)
+DataScope = namedtuple('DataScope', ['cohort', 'regions'])
+
+# -----------------------------------------------------------------------------
+# 공통 상수 (라벨 순서, 좌표, 구간)
+# -----------------------------------------------------------------------------
+# 라벨 순서는 전처리와 같은 코드북에서 (코드 순서 = 표시 순서)
+EDU_ORDER = label_order('edu')
+HEALTH_ORDER = label_order('health')
+
+# 일 경험으로 인정하는 활동 유형 / 파이 차트 표시 순서
+WORK_EXPERIENCE_TYPES = ['인턴/현장실습', '아르바이트', '창업 경험']
+EXP_TYPE_ORDER = ["인턴/현장실습", "아르바이트", "창업 경험", "기타", "경험 없음"]
+
+# 진로 심리 레이더 차트 (컬럼 → 축 이름)
+PSYCH_RADAR_COLS = [
+    'avg_career_plan_score', 'avg_trouble_deciding_career',
+    'avg_uncertain_decision_pending', 'avg_aptitude_not_known'
+]
+PSYCH_RADAR_CATEGORIES = ['계획 명확성', '결정 어려움', '진로 불확실성', '적성 모름']
+
+# 지역 상세 분석 레이더 차트 (축 이름 → 지역 집계 컬럼)
+REGION_RADAR_METRICS = {
+    '취업 성공률': 'got_job_flag',
+    '자아효능감': 'self_efficacy',
+    '진로계획': 'career_plan_score',
+    '일 경험률': 'experience'
+}
+
+REGION_COORDS = {
+    '서울': [37.5665, 126.9780], '부산': [35.1796, 129.0756], '대구': [35.8714, 128.6014],
+    '인천': [37.4563, 126.7052], '광주': [35.1601, 126.8517], '대전': [36.3504, 127.3845],
+    '울산': [35.5384, 129.3114], '세종': [36.4800, 127.2890], '경기': [37.4138, 127.5183],
+    '강원': [37.8228, 128.1555], '충북': [36.6350, 127.4914], '충남': [36.5184, 126.8000],
+    '전북': [35.7175, 127.1530], '전남': [34.8161, 126.4629], '경북': [36.5783, 128.5093],
+    '경남': [35.2383, 128.6925], '제주': [33.4996, 126.5312]
+}
+REGIONS = list(REGION_COORDS)
+
+# 금융자산: 1억 원(10,000만원) 이하만 분석, 구간은 0원 / 500만원 미만 / 2000만원 미만 / 2000만원 이상
+ASSET_CAP = 10000
+ASSET_BINS = [-1, 0, 500, 2000, float('inf')]
+ASSET_LABELS = ['자산 없음(0원)', '500만원 미만', '500~2,000만원', '2,000만원 이상']
+
+
+# -----------------------------------------------------------------------------
+# 1. 데이터 로드
+# -----------------------------------------------------------------------------
+def prepare_data(df):
+    """전처리된 CSV에 화면용 파생 컬럼(순서형 라벨, 일 경험, 연령대)을 추가"""
+    df['edu_label'] = pd.Categorical(df['edu_label'], categories=EDU_ORDER, ordered=True)
+    df['health_label'] = pd.Categorical(df['health_label'], categories=HEALTH_ORDER, ordered=True)
+    df['experience'] = df['exp_type'].isin(WORK_EXPERIENCE_TYPES).astype(int)
+    df['age_group'] = pd.cut(df['age'], bins=[18, 24, 29], labels=['19-24세', '25-29세'])
+    return df
+
+
+def available_cohorts():
+    """선택 가능한 코호트 목록 (파티션이 없으면 단일 CSV의 LEGACY_COHORT)"""
+    return neet_dataset.list_cohorts() or [LEGACY_COHORT]
+
+
+def make_scope(cohort, regions=None):
+    """캐시 키로 쓸 수 있도록 지역 목록을 정렬된 튜플로 고정 (빈 목록 = 전체)"""
+    return DataScope(cohort, tuple(sorted(regions)) if regions else None)
+
+
+def default_scope():
+    return make_scope(available_cohorts()[-1])
+
+
+def read_scope(scope):
+    """scope에 해당하는 파티션만 읽어 화면용 컬럼까지 준비 (캐시 없음)"""
+    if neet_dataset.list_cohorts():
+        df = neet_dataset.read_dataset(scope.cohort, scope.regions)
+    else:
+        df = pd.read_csv(DATA_PATH)
+        df['cohort'] = LEGACY_COHORT
+        if scope.regions is not None:
+            df = df[df['region_label'].isin(scope.regions)].reset_index(drop=True)
+    return prepare_data(df)
+
+
+def data_version(cohort):
+    """코호트 데이터가 바뀌면 달라지는 버전 문자열 (수정 시각 + 크기)"""
+    if neet_dataset.list_cohorts():
+        return neet_dataset.dataset_version(cohort)
+    stat = os.stat(DATA_PATH)
+    return f"{stat.st_mtime_ns}-{stat.st_size}"
+
+
+@st.cache_data
+def load_data(scope):
+    """scope의 파티션만 로드. 데이터가 없으면 FileNotFoundError를 그대로 올립니다."""
+    return read_scope(scope)
+
+
+# -----------------------------------------------------------------------------
+# 2. 집계 (순수 함수)
+# -----------------------------------------------------------------------------
+def build_outcome_means(df):
+    """취업 성공/미취업 그룹별 진로 심리 점수 평균"""
+    return df.groupby('outcome')[PSYCH_RADAR_COLS].mean().reset_index()
+
+
+def build_region_table(df):
+    """지역별 인원·취업 성공률·자아효능감·진로계획·일 경험률 집계 (+ 지도 좌표)"""
+    agg_funcs = {
+        'sampid': 'count',
+        'got_job_flag': 'mean',
+        'self_efficacy': 'mean',
+        'career_plan_score': 'mean',
+        'experience': 'mean'
+    }
+    table = df.groupby('region_label', observed=False).agg(agg_funcs).reset_index()
+
+    # 표시용 컬럼 계산
+    table['취업 성공률(%)'] = (table['got_job_flag'] * 100).round(1)
+    table['자아효능감(점)'] = table['self_efficacy'].round(2)
+    table['진로계획 명확성(점)'] = table['career_plan_score'].round(2)
+    table['일 경험률(%)'] = (table['experience'] * 100).round(1)
+
+    # 좌표 매핑
+    table['lat'] = table['region_label'].map(lambda x: REGION_COORDS.get(x, [None, None])[0])
+    table['lon'] = table['region_label'].map(lambda x: REGION_COORDS.get(x, [None, None])[1])
+    return table
+
+
+def build_map_points(table):
+    """지도에 찍을 수 있는(좌표가 있는) 지역만 남긴 표. 행 순서 = 지도 point_index"""
+    return table.dropna(subset=['lat', 'lon']).reset_index(drop=True)
+
+
+def build_asset_group_rates(df):
+    """(취업 상태별 평균 자산액, 자산 구간별 취업 성공률)"""
+    # NaN(무응답)을 제외하고 1억 원 이하만 포함
+    valid_asset_df = df.dropna(subset=['total_asset_amount']).copy()
+    valid_asset_df = valid_asset_df[valid_asset_df['total_asset_amount'] <= ASSET_CAP]
+
+    avg_asset_by_job = valid_asset_df.groupby('outcome', observed=False)['total_asset_amount'].mean().reset_index()
+    avg_asset_by_job['amount'] = avg_asset_by_job['total_asset_amount'].round(0)  # 만원 단위
+
+    valid_asset_df['asset_group'] = pd.cut(valid_asset_df['total_asset_amount'], bins=ASSET_BINS, labels=ASSET_LABELS)
+    job_rate_by_asset_group = valid_asset_df.groupby('asset_group', observed=False)['got_job_flag'].mean().reset_index()
+    job_rate_by_asset_group['rate'] = (job_rate_by_asset_group['got_job_flag'] * 100).round(1)
+    return avg_asset_by_job, job_rate_by_asset_group
+
+
+def build_region_report(df, table, region):
+    """지역 상세 분석에 필요한 지표·활동경험 분포·전국 대비 점수·강점/약점"""
+    region_data = table[table['region_label'] == region].iloc[0]
+    national_avg = table.mean(numeric_only=True)
+
+    exp_counts = df.loc[df['region_label'] == region, 'exp_type'].value_counts().reindex(
+        EXP_TYPE_ORDER, fill_value=0
+    )
+
+    # 전국 평균 대비 % 계산
+    radar_r = []
+    for col in REGION_RADAR_METRICS.values():
+        nat = national_avg[col]
+        radar_r.append((region_data[col] / nat * 100) if nat > 0 else 0)
+    categories = list(REGION_RADAR_METRICS)
+
+    max_idx = radar_r.index(max(radar_r))
+    min_idx = radar_r.index(min(radar_r))
+
+    return {
+        'region': region,
+        'metrics': {
+            '대상 인원': int(region_data['sampid']),
+            '취업 성공률': region_data['취업 성공률(%)'],
+            '자아효능감': region_data['자아효능감(점)'],
+            '진로계획 명확성': region_data['진로계획 명확성(점)'],
+            '일 경험률': region_data['일 경험률(%)'],
+        },
+        'exp_counts': exp_counts,
+        'radar_r': radar_r,
+        'categories': categories,
+        'strong_point': categories[max_idx],
+        'strong_value': radar_r[max_idx],
+        'weak_point': categories[min_idx],
+    }
+
+
+def region_insight_text(report):
+    """지역 리포트의 강점/약점 요약 문장 (Markdown)"""
+    return f"""
+    **💡 Insight**
+    
+    **{report['region']}** 지역은 전국 평균 대비
+    **'{report['strong_point']}'** 수치가 **{report['strong_value']:.1f}**점으로 가장 우수합니다.
+    
+    반면, **'{report['weak_point']}'** 수치는 상대적으로 보완이 필요해 보입니다.
+    """
+
+
+# -----------------------------------------------------------------------------
+# 3. 캐시 래퍼 (앱과 warm-up이 공유)
+# -----------------------------------------------------------------------------
+@st.cache_data
+def outcome_means(scope):
+    return build_outcome_means(load_data(scope))
+
+
+@st.cache_data
+def region_table(scope):
+    return build_region_table(load_data(scope))
+
+
+@st.cache_data
+def map_points(scope):
+    return build_map_points(region_table(scope))
+
+
+@st.cache_data
+def asset_group_rates(scope):
+    return build_asset_group_rates(load_data(scope))
+
+
+@st.cache_data
+def region_report(cohort, region):
+    """지역 상세 분석. 그 지역 파티션과 코호트 전체 지역 집계(전국 평균)만 사용"""
+    region_df = load_data(make_scope(cohort, [region]))
+    return build_region_report(region_df, region_table(make_scope(cohort)), region)
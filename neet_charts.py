@@ -0,0 +1,291 @@
+"""대시보드 Plotly 차트 생성 함수.
+
+각 함수는 완성된 Figure를 돌려주며, 화면 상태(scope, 선택 지역)를 키로
+모든 세션이 공유하는 캐시(neet_shared_cache)에 보관됩니다.
+앱은 st.plotly_chart에 그대로 넘기기만 하고(Figure를 수정하지 않음), cache_warmer.py는
+같은 함수를 미리 호출해 첫 방문자가 차트 생성 비용을 내지 않도록 합니다.
+공통 다크 테마는 neet_figures의 'neet_dark' 템플릿이 적용합니다.
+"""
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+import neet_analysis as na
+import neet_figures as nf
+from neet_shared_cache import shared_result
+
+# 색상 팔레트 정의 (성공/실패) - 네온 느낌
+COLOR_SUCCESS = "#00E676"  # Bright Green
+COLOR_FAIL = "#FF5252"     # Bright Red
+COLOR_MAP = {"취업 성공": COLOR_SUCCESS, "미취업": COLOR_FAIL}
+
+# 색상 맵 정의 (자산 분석: 파랑(성공) / 주황(미취업))
+OUTCOME_COLOR_MAP = {'취업 성공': '#29B6F6', '미취업': '#FF7043'}
+
+
+# ==============================
+# TAB 1: 진로 심리
+# ==============================
+@shared_result
+def psych_radar_figure(scope):
+    avg_diff = na.outcome_means(scope)
+    categories = na.PSYCH_RADAR_CATEGORIES
+    fig = nf.figure(polar=True)
+
+    # 취업 성공 군
+    if '취업 성공' in avg_diff['outcome'].values:
+        success_vals = avg_diff[avg_diff['outcome'] == '취업 성공'][na.PSYCH_RADAR_COLS].values[0].tolist()
+        fig.add_trace(go.Scatterpolar(
+            r=success_vals + [success_vals[0]], theta=categories + [categories[0]],
+            fill='toself', name='취업 성공', line_color=COLOR_SUCCESS, opacity=0.8
+        ))
+
+    # 미취업 군
+    if '미취업' in avg_diff['outcome'].values:
+        fail_vals = avg_diff[avg_diff['outcome'] == '미취업'][na.PSYCH_RADAR_COLS].values[0].tolist()
+        fig.add_trace(go.Scatterpolar(
+            r=fail_vals + [fail_vals[0]], theta=categories + [categories[0]],
+            fill='toself', name='미취업', line_color=COLOR_FAIL, opacity=0.6
+        ))
+
+    fig.update_layout(polar=dict(
+        radialaxis=dict(visible=True, range=[1, 5], showticklabels=False),
+        angularaxis=dict(tickfont=dict(size=12))
+    ))
+    return fig
+
+
+@shared_result
+def psych_box_figure(scope, column):
+    fig = nf.box(na.load_data(scope), y=column, x="outcome", color="outcome", color_discrete_map=COLOR_MAP)
+    fig.update_layout(showlegend=False, height=200)
+    return fig
+
+
+# ==============================
+# TAB 2: 지도
+# ==============================
+@shared_result
+def region_map_figure(scope):
+    fig = nf.scatter_mapbox(
+        na.map_points(scope),
+        lat="lat", lon="lon",
+        size="sampid",
+        color="취업 성공률(%)",
+        color_continuous_scale="Tealgrn",  # 디자인 테마에 맞춘 컬러
+        size_max=40,
+        zoom=6,
+        center={"lat": 36.5, "lon": 127.8},
+        mapbox_style="carto-darkmatter",  # 다크 모드 지도
+        hover_name="region_label",
+        hover_data={"lat": False, "lon": False, "sampid": True, "취업 성공률(%)": True}
+    )
+    fig.update_layout(margin={"r": 0, "t": 0, "l": 0, "b": 0})
+    return fig
+
+
+def build_region_pie_figure(report):
+    """지역 리포트(neet_analysis.build_region_report) → 활동경험 분포 파이 차트"""
+    region, exp_counts = report['region'], report['exp_counts']
+    fig = nf.pie(
+        names=exp_counts.index,
+        values=exp_counts.values,
+        hole=0.4,
+        title=f"{region} 활동경험 비율",
+        color_discrete_sequence=px.colors.sequential.Teal
+    )
+    fig.update_traces(textinfo='percent+label')
+    return fig
+
+
+def build_region_radar_figure(report):
+    """지역 리포트 → 전국 평균(100) 대비 레이더 차트"""
+    region = report['region']
+    radar_df = pd.DataFrame(dict(r=report['radar_r'], theta=report['categories']))
+    fig = nf.line_polar(
+        radar_df,
+        r='r', theta='theta',
+        line_close=True,
+        title=f"{region} vs 전국 평균(100)"
+    )
+
+    fig.update_traces(fill='toself', line_color=COLOR_SUCCESS)  # 형광 초록
+    fig.update_layout(polar=dict(
+        radialaxis=dict(visible=True, tickfont=dict(color="gray")),
+        angularaxis=dict(tickfont=dict(size=13))
+    ))
+    return fig
+
+
+@shared_result
+def region_pie_figure(cohort, region):
+    return build_region_pie_figure(na.region_report(cohort, region))
+
+
+@shared_result
+def region_radar_figure(cohort, region):
+    return build_region_radar_figure(na.region_report(cohort, region))
+
+
+# ==============================
+# TAB 3: 구직 경로
+# ==============================
+def _answered_search_df(scope):
+    df = na.load_data(scope)
+    return df[df['search_method'] != '응답 없음']
+
+
+@shared_result
+def search_count_figure(scope):
+    path_counts = _answered_search_df(scope)['search_method'].value_counts().reset_index()
+    path_counts.columns = ['구직 경로', '인원수']
+    fig = nf.bar(path_counts, x='인원수', y='구직 경로', orientation='h', text='인원수',
+                 color='인원수', color_continuous_scale='Bluyl')
+    fig.update_layout(yaxis={'categoryorder': 'total ascending'},
+                      title={'text': "가장 많이 시도한 방법", 'font': {'size': 17}})
+    return fig
+
+
+@shared_result
+def search_success_figure(scope):
+    search_df = _answered_search_df(scope)
+    method_counts = search_df['search_method'].value_counts()
+    valid_methods = method_counts[method_counts >= 5].index
+    valid_df = search_df[search_df['search_method'].isin(valid_methods)]
+
+    path_succ = valid_df.groupby('search_method')['got_job_flag'].mean().reset_index()
+    path_succ['성공률'] = path_succ['got_job_flag'] * 100
+    path_succ = path_succ.sort_values(by='성공률', ascending=False)
+
+    fig = nf.bar(path_succ, x='성공률', y='search_method', orientation='h', text_auto='.1f',
+                 color='성공률', color_continuous_scale='Greens')
+    fig.update_layout(yaxis={'categoryorder': 'total ascending'},
+                      title={'text': "실제 성공률이 높은 방법", 'font': {'size': 17}})
+    return fig
+
+
+# ==============================
+# TAB 4: 어려움 Top 5
+# ==============================
+@shared_result
+def difficulty_figure(scope):
+    df = na.load_data(scope)
+    diff_counts = df['main_difficulty'].value_counts().drop("해당없음", errors='ignore').head(5)
+    diff_df = pd.DataFrame({"항목": diff_counts.index, "빈도": diff_counts.values})
+    diff_df["비율"] = (diff_df["빈도"] / len(df) * 100).round(1)
+
+    fig = nf.bar(diff_df, x="항목", y="비율", text="비율", color="항목",
+                 color_discrete_sequence=px.colors.qualitative.Pastel)
+    fig.update_traces(texttemplate='%{text}%', textposition='outside')
+    fig.update_layout(showlegend=False, height=500, font=dict(size=14))
+    return fig
+
+
+# ==============================
+# TAB 5: 인구통계 / 금융자산
+# ==============================
+@shared_result
+def gender_figure(scope):
+    fig = nf.histogram(na.load_data(scope), x="gender_label", color="outcome", barmode="group", text_auto=True,
+                       color_discrete_map=COLOR_MAP, title="성별 취업 성공 현황")
+    return fig
+
+
+@shared_result
+def age_gender_figure(scope):
+    grouped = na.load_data(scope).groupby(['age_group', 'gender_label'], observed=False)['got_job_flag'].mean().reset_index()
+    grouped['rate'] = grouped['got_job_flag'] * 100
+
+    fig = nf.bar(grouped, x='age_group', y='rate', color='gender_label', barmode='group',
+                 text_auto='.1f', title="연령대/성별 성공률 (%)",
+                 color_discrete_map={'남성': '#29B6F6', '여성': '#FF7043'})
+    return fig
+
+
+@shared_result
+def asset_avg_figure(scope):
+    avg_asset_by_job, _ = na.asset_group_rates(scope)
+    fig = nf.bar(
+        avg_asset_by_job,
+        x="outcome",
+        y="amount",
+        color="outcome",
+        text_auto=',.0f',  # 천단위 콤마
+        title="취업/미취업 그룹 평균 자산 (단위: 만원)",
+        labels={'outcome': '취업 상태', 'amount': '평균 자산(만원)'},
+        color_discrete_map=OUTCOME_COLOR_MAP
+    )
+    return fig
+
+
+@shared_result
+def asset_rate_figure(scope):
+    _, job_rate_by_asset_group = na.asset_group_rates(scope)
+    fig = nf.bar(
+        job_rate_by_asset_group,
+        x="asset_group",
+        y="rate",
+        color="asset_group",
+        text_auto='.1f',
+        title="자산 구간별 취업 성공률 (%)",
+        labels={'asset_group': '금융자산 규모', 'rate': '취업 성공률(%)'},
+        # 자산 규모가 커질수록 진한 색상 (Sequential Blues)
+        color_discrete_sequence=px.colors.sequential.Blues
+    )
+    fig.update_layout(yaxis_range=[0, 100])  # Y축 100% 고정
+    return fig
+
+
+# ==============================
+# TAB 6: 학력 및 지역
+# ==============================
+@shared_result
+def edu_figure(scope):
+    fig = nf.histogram(na.load_data(scope), x="edu_label", color="outcome", barmode="group",
+                       color_discrete_map=COLOR_MAP, title="학력별 분포")
+    return fig
+
+
+@shared_result
+def region_distribution_figure(scope):
+    fig = nf.histogram(na.load_data(scope), y="region_label", color="outcome", barmode="stack", orientation='h',
+                       color_discrete_map=COLOR_MAP, title="지역별 분포")
+    fig.update_layout(yaxis={'categoryorder': 'total ascending'})
+    return fig
+
+
+# ==============================
+# TAB 7: 건강
+# ==============================
+@shared_result
+def health_figure(scope):
+    df = na.load_data(scope)
+    health_counts = df.groupby(['health_label', 'outcome'], observed=False).size().reset_index(name='count')
+    health_total = df.groupby('health_label', observed=False).size().reset_index(name='total')
+    merged = health_counts.merge(health_total, on='health_label')
+    merged['ratio'] = merged['count'] / merged['total'] * 100
+
+    fig = nf.bar(merged, x="health_label", y="ratio", color="outcome", text_auto='.1f',
+                 color_discrete_map=COLOR_MAP, title="주관적 건강 상태별 취업률")
+    fig.update_layout(yaxis={'categoryorder': 'total ascending'})
+    return fig
+
+
+# 지역 선택 없이 화면에 바로 보이는 차트 목록 (warm-up 대상). 값은 scope를 받는 함수
+DEFAULT_FIGURES = {
+    'psych_radar': psych_radar_figure,
+    'psych_box:avg_career_plan_score': lambda scope: psych_box_figure(scope, 'avg_career_plan_score'),
+    'psych_box:avg_trouble_deciding_career': lambda scope: psych_box_figure(scope, 'avg_trouble_deciding_career'),
+    'psych_box:avg_uncertain_decision_pending': lambda scope: psych_box_figure(scope, 'avg_uncertain_decision_pending'),
+    'region_map': region_map_figure,
+    'search_count': search_count_figure,
+    'search_success': search_success_figure,
+    'difficulty': difficulty_figure,
+    'gender': gender_figure,
+    'age_gender': age_gender_figure,
+    'asset_avg': asset_avg_figure,
+    'asset_rate': asset_rate_figure,
+    'edu': edu_figure,
+    'region_distribution': region_distribution_figure,
+    'health': health_figure,
+}
@@ -0,0 +1,180 @@
+"""청년패널 원자료 코드북: 변수별 유효 범위·무응답 코드·라벨.
+
+전처리(neet_data.py)는 선택한 원자료 변수 전체를 clean()으로 한 번에 정리하고,
+라벨이 필요한 변수는 decode()로 범주형으로 바꿉니다. 대시보드(neet_analysis)도
+라벨 순서(학력, 건강 등)를 여기서 가져오므로 두 곳의 순서가 항상 같습니다.
+
+CODEBOOK 항목
+- range     : (최소, 최대) 유효 범위. None이면 그쪽 제한 없음
+- sentinels : 무응답/거절/비해당 코드 → 결측 처리
+- labels    : LABELS의 라벨 이름 (decode용). 라벨이 있는 코드만 유효하며,
+              범위 안이라도 라벨이 없는 코드(예: 구직경로 16~96)는 invalid로 집계
+"""
+import numpy as np
+import pandas as pd
+
+# -----------------------------------------------------------------------------
+# 1. 라벨 (코드 → 표시 이름, 표시 순서 = 코드 순서)
+# -----------------------------------------------------------------------------
+LABELS = {
+    'gender': {1: '남성', 2: '여성'},
+    'edu': {1: '고졸 미만', 2: '고졸', 3: '전문대졸', 4: '대졸', 5: '대학원졸'},
+    'health': {1: '매우 나쁨', 2: '나쁜 편', 3: '보통', 4: '좋은 편', 5: '매우 좋음'},
+    'yes_no': {1: '있음', 2: '없음'},
+    'region': {
+        1:'서울', 2:'부산', 3:'대구', 4:'인천', 5:'광주', 6:'대전', 7:'울산',
+        8:'경기', 9:'강원', 10:'충북', 11:'충남', 12:'전북', 13:'전남',
+        14:'경북', 15:'경남', 16:'제주', 17:'세종'
+    },
+    'search': {
+        1:'학교 선생님(교수)', 2:'학교 취업정보센터', 3:'언론매체', 4:'부모/친척',
+        5:'지인(친구/선후배)', 6:'공공 취업알선기관', 7:'민간 취업알선기관',
+        8:'공공 취업포털(워크넷)', 9:'민간 취업포털(사람인 등)', 10:'커뮤니티',
+        11:'기업 홈페이지/SNS', 12:'채용설명회', 13:'학원', 14:'현장실습/인턴십',
+        15:'헤드헌터', 97:'기타'
+    },
+    'work_exp': {
+        1:'체험형 인턴', 2:'채용형 인턴', 3:'아르바이트',
+        4:'창업', 5:'프리랜서', 97:'기타'
+    },
+    'difficulty': {
+        1:'일자리 부족', 2:'정보 부족', 3:'적성 불일치', 4:'자격요건 미달',
+        5:'임금/조건 불일치', 6:'면접 기술 부족', 7:'자신감 결여', 97:'기타'
+    },
+}
+
+# 금액·기간·횟수 문항의 무응답/모름/거절 코드
+AMOUNT_SENTINELS = [999999, 9090908, 9090909]
+COUNT_SENTINELS = [9090908, 9090909]
+
+LIKERT = {'range': (1, 5)}
+
+# -----------------------------------------------------------------------------
+# 2. 원자료 변수 코드북
+# -----------------------------------------------------------------------------
+CODEBOOK = {
+    'gender': {'labels': 'gender'},
+    'birthy': {'range': (1900, None)},
+    'w01ecoact': {'range': (1, 3)},
+    'w01student': {'range': (1, 2)},
+    'w01edu': {'labels': 'edu'},
+    'w01region': {'labels': 'region'},
+    'y01e606': {'labels': 'health'},
+    'y01a601': {'range': (1, 2)},
+    'y01a616_1': {'labels': 'work_exp'},
+    'y01e401': {'labels': 'yes_no'},
+    'y01e501': LIKERT, 'y01e510': LIKERT, 'y01e511': LIKERT, 'y01e519': LIKERT,
+    'w01edu_f': {'labels': 'edu'},
+    'w01edu_m': {'labels': 'edu'},
+    'y01a439': {'labels': 'yes_no'},
+    'y01e513': LIKERT, 'y01e514': LIKERT, 'y01e515': LIKERT,
+    'y01c768a': {'labels': 'search'},
+    'y01a617_1': {},
+    'y01a630_1': {},
+    'y01c116': {'range': (1, 2)},
+    'y01c136': {'range': (1, 2)},
+    'y01c603d': {'range': (0, None), 'sentinels': COUNT_SENTINELS},
+    'y01c604': {'range': (0, None), 'sentinels': COUNT_SENTINELS},
+    'y01c771a': {'labels': 'difficulty'},
+    'y01f507': {'range': (1, 2)},
+    'y01f508': {'range': (0, None), 'sentinels': AMOUNT_SENTINELS},
+    'w02ecoact': {'range': (1, 3)},
+    'w02student': {'range': (1, 2)},
+    'y02e501': LIKERT, 'y02e510': LIKERT, 'y02e511': LIKERT, 'y02e519': LIKERT,
+    'w03ecoact': {'range': (1, 3)},
+    'w03student': {'range': (1, 2)},
+    'y03e501': LIKERT, 'y03e510': LIKERT, 'y03e511': LIKERT, 'y03e519': LIKERT,
+}
+
+
+def label_order(name):
+    """라벨 표시 순서 (예: label_order('edu') → ['고졸 미만', ..., '대학원졸'])"""
+    return list(LABELS[name].values())
+
+
+def _bounds(spec):
+    # 라벨 변수는 범위 대신 라벨 코드 목록으로 검사 (clean 참고)
+    lo, hi = spec.get('range', (None, None))
+    return (-np.inf if lo is None else lo), (np.inf if hi is None else hi)
+
+
+# -----------------------------------------------------------------------------
+# 3. 정리 (한 번의 배열 연산)
+# -----------------------------------------------------------------------------
+def clean(df, codebook=CODEBOOK):
+    """코드북에 있는 컬럼을 숫자로 바꾸고 무응답 코드·범위 밖 값을 결측 처리.
+
+    (정리된 컬럼 DataFrame, 검증 리포트)를 돌려줍니다. 리포트는 변수별로
+    원래 결측(missing), 숫자가 아니거나 라벨 없는 코드(invalid), 무응답 코드(sentinel),
+    범위 밖 값(out_of_range) 개수를 담습니다.
+    """
+    cols = [c for c in codebook if c in df.columns]
+    raw = df[cols]
+    missing = raw.isna().to_numpy()
+    try:
+        values = raw.to_numpy(dtype=float)
+    except (ValueError, TypeError):
+        # 문자열이 섞인 경우에만 컬럼별 변환
+        values = raw.apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)
+
+    specs = [codebook[c] for c in cols]
+    lo, hi = (np.array(bound, dtype=float) for bound in zip(*(_bounds(spec) for spec in specs)))
+
+    # 무응답 코드 표: (컬럼별 최대 코드 수, 컬럼 수), 빈 칸은 NaN(어떤 값과도 같지 않음)
+    depth = max((len(spec.get('sentinels', ())) for spec in specs), default=0)
+    sentinels = np.full((depth, len(cols)), np.nan)
+    for j, spec in enumerate(specs):
+        codes = spec.get('sentinels', ())
+        sentinels[:len(codes), j] = codes
+
+    is_sentinel = np.zeros(values.shape, dtype=bool)
+    for row in sentinels:
+        is_sentinel |= values == row
+
+    is_nan = np.isnan(values)
+    out_of_range = ~is_nan & ~is_sentinel & ((values < lo) | (values > hi))
+
+    # 라벨 변수: 라벨 코드에 없는 값 (컬럼마다 한 번의 isin)
+    unlabeled = np.zeros(values.shape, dtype=bool)
+    for j, spec in enumerate(specs):
+        if 'labels' in spec:
+            unlabeled[:, j] = ~np.isin(values[:, j], list(LABELS[spec['labels']]))
+    unlabeled &= ~is_nan & ~is_sentinel
+
+    values[is_sentinel | out_of_range | unlabeled] = np.nan
+
+    report = pd.DataFrame({
+        'missing': missing.sum(axis=0),
+        'invalid': ((is_nan & ~missing) | unlabeled).sum(axis=0),
+        'sentinel': is_sentinel.sum(axis=0),
+        'out_of_range': out_of_range.sum(axis=0),
+    }, index=cols)
+    return pd.DataFrame(values, columns=cols, index=df.index), report
+
+
+def decode(values, name, fill=None):
+    """숫자 코드 Series → 라벨 Categorical Series. 라벨이 없는 코드/결측은 fill (없으면 NaN)"""
+    labels = LABELS[name]
+    categories = list(labels.values())
+    lookup = np.full(max(labels) + 1, -1, dtype=np.int64)
+    lookup[list(labels)] = np.arange(len(labels))
+
+    v = pd.to_numeric(values, errors='coerce').to_numpy(dtype=float)
+    ok = ~np.isnan(v) & (v >= 0) & (v < len(lookup)) & (v == np.floor(v))
+    codes = np.full(len(v), -1, dtype=np.int64)
+    codes[ok] = lookup[v[ok].astype(np.int64)]
+
+    decoded = pd.Series(pd.Categorical.from_codes(codes, categories=categories), index=values.index)
+    if fill is not None:
+        if fill not in categories:
+            decoded = decoded.cat.add_categories([fill])
+        decoded = decoded.fillna(fill)
+    return decoded
+
+
+def format_report(report):
+    """문제가 있는 변수만 남긴 검증 리포트 문자열"""
+    flagged = report[(report[['invalid', 'sentinel', 'out_of_range']] > 0).any(axis=1)]
+    if flagged.empty:
+        return "검증: 잘못된 코드/무응답 코드/범위 밖 값 없음"
+    return "검증 (잘못된 코드/무응답 코드/범위 밖 값이 있는 변수):\n" + flagged.to_string()
@@ -0,0 +1,112 @@
+"""코호트·지역 단위로 나눠 저장하는 전처리 데이터셋.
+
+neet_data.py가 쓰고 대시보드가 읽는 저장 형식입니다.
+
+    data/neet/cohort=YP2021/region=01/part.csv
+    data/neet/cohort=YP2021/region=02/part.csv
+    ...
+
+지역 폴더 이름은 w01region 코드(두 자리)입니다. 지역 코드가 없거나 코드북 범위 밖인
+응답자는 region=00(UNKNOWN_REGION)에 저장해 코호트 전체 집계에 그대로 포함됩니다.
+읽을 때는 요청한 코호트·지역의 폴더만 열기 때문에, 한 코호트의 한 지역을 읽으면
+그 파티션 파일만 읽습니다.
+"""
+import os
+
+import pandas as pd
+
+from neet_codebook import LABELS
+
+DATASET_ROOT = os.path.join("data", "neet")
+PART_FILE = "part.csv"
+
+REGION_MAP = LABELS['region']
+REGION_CODES = {label: code for code, label in REGION_MAP.items()}
+UNKNOWN_REGION = 0  # 지역 미상 파티션 (지역 필터로는 선택되지 않음)
+
+
+def partition_dir(cohort, region_code, root=DATASET_ROOT):
+    return os.path.join(root, f"cohort={cohort}", f"region={int(region_code):02d}")
+
+
+def _partition_value(name, key):
+    prefix = f"{key}="
+    return name[len(prefix):] if name.startswith(prefix) else None
+
+
+# -----------------------------------------------------------------------------
+# 쓰기
+# -----------------------------------------------------------------------------
+def write_dataset(df, cohort, root=DATASET_ROOT):
+    """전처리 결과를 지역 코드별로 나눠 저장. 해당 코호트의 기존 파티션은 교체됩니다."""
+    cohort_dir = os.path.join(root, f"cohort={cohort}")
+    if os.path.isdir(cohort_dir):
+        for name in os.listdir(cohort_dir):
+            old = os.path.join(cohort_dir, name, PART_FILE)
+            if _partition_value(name, "region") is not None and os.path.exists(old):
+                os.remove(old)
+
+    written = []
+    # 결측/범위 밖 지역 코드도 빠뜨리지 않도록 지역 미상 파티션으로 모음
+    region_codes = df['w01region'].where(df['w01region'].isin(list(REGION_MAP)), UNKNOWN_REGION)
+    for region_code, part in df.groupby(region_codes):
+        path = partition_dir(cohort, region_code, root)
+        os.makedirs(path, exist_ok=True)
+        part.to_csv(os.path.join(path, PART_FILE), index=False, encoding="utf-8-sig")
+        written.append(path)
+    return written
+
+
+# -----------------------------------------------------------------------------
+# 읽기 (파티션 가지치기)
+# -----------------------------------------------------------------------------
+def list_cohorts(root=DATASET_ROOT):
+    """데이터셋에 있는 코호트 이름 (정렬)"""
+    if not os.path.isdir(root):
+        return []
+    return sorted(
+        value for value in (_partition_value(name, "cohort") for name in os.listdir(root))
+        if value
+    )
+
+
+def partition_files(cohort, regions=None, root=DATASET_ROOT):
+    """읽어야 할 파티션 파일 목록. regions(지역 이름들)가 None이면 코호트 전체"""
+    cohort_dir = os.path.join(root, f"cohort={cohort}")
+    if not os.path.isdir(cohort_dir):
+        return []
+
+    wanted = None if regions is None else {REGION_CODES[r] for r in regions if r in REGION_CODES}
+    files = []
+    for name in sorted(os.listdir(cohort_dir)):
+        code = _partition_value(name, "region")
+        if code is None or (wanted is not None and int(code) not in wanted):
+            continue
+        path = os.path.join(cohort_dir, name, PART_FILE)
+        if os.path.exists(path):
+            files.append(path)
+    return files
+
+
+def read_dataset(cohort, regions=None, root=DATASET_ROOT):
+    """요청한 코호트·지역 파티션만 읽어 하나의 DataFrame으로 합칩니다.
+
+    코호트 파티션이 하나도 없으면 FileNotFoundError. 코호트는 있지만 선택한 지역의
+    파티션이 없으면(응답자 0명) 같은 컬럼·타입의 빈 DataFrame을 돌려줍니다.
+    """
+    files = partition_files(cohort, regions, root)
+    if files:
+        df = pd.concat([pd.read_csv(path) for path in files], ignore_index=True)
+    else:
+        cohort_files = partition_files(cohort, root=root) if regions is not None else []
+        if not cohort_files:
+            raise FileNotFoundError(f"{root}에 cohort={cohort} 파티션이 없습니다.")
+        df = pd.read_csv(cohort_files[0]).iloc[:0].copy()
+    df['cohort'] = cohort
+    return df
+
+
+def dataset_version(cohort, root=DATASET_ROOT):
+    """코호트 파티션들의 (최근 수정 시각, 총 크기) 버전 문자열"""
+    stats = [os.stat(path) for path in partition_files(cohort, root=root)]
+    return f"{max((s.st_mtime_ns for s in stats), default=0)}-{sum(s.st_size for s in stats)}"
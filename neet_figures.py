@@ -0,0 +1,119 @@
+"""차트 공통 테마와 Figure 생성 함수.
+
+다크 테마는 import 시 Plotly 템플릿 'neet_dark'로 한 번만 등록하고,
+모든 차트는 이 모듈의 함수로 만들어 템플릿을 이름으로 적용합니다.
+기본 'plotly' 템플릿보다 훨씬 작은 템플릿만 Figure JSON에 실립니다.
+축(automargin, zeroline 등)과 hover 설정은 기본 템플릿에서 그대로 가져오고,
+크기의 대부분을 차지하는 trace별 기본값·컬러스케일만 뺍니다.
+
+단, 브라우저의 Streamlit 테마(theme="streamlit")는 자기 값을 layout.template.layout에
+덮어쓰므로 템플릿에만 둔 배경·글꼴·여백·범례·격자 색은 화면에서 사라집니다.
+이 값들(THEME_LAYOUT)은 생성 함수가 각 Figure의 layout에도 직접 넣습니다.
+
+차트별로 다른 설정(높이, 축 범위, 색상 등)만 각 차트 함수에서 지정합니다.
+"""
+import plotly.express as px
+import plotly.graph_objects as go
+import plotly.io as pio
+
+TEMPLATE = "neet_dark"
+
+TRANSPARENT = "rgba(0,0,0,0)"
+GRID_COLOR = "rgba(255,255,255,0.1)"
+POLAR_GRID_COLOR = "rgba(255,255,255,0.2)"
+
+
+# 템플릿보다 우선해야 하는 값 (Streamlit 테마가 덮어쓰지 못하도록 Figure layout에 설정)
+THEME_LAYOUT = dict(
+    paper_bgcolor=TRANSPARENT,   # 전체 배경 투명
+    plot_bgcolor=TRANSPARENT,    # 플롯 배경 투명
+    font=dict(color="#e0e0e0"),  # 폰트 색상 밝게
+    title_font_color="#ffffff",
+    margin=dict(l=20, r=20, t=40, b=20),
+    legend=dict(
+        orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1,
+        font=dict(color="white")
+    ),
+    xaxis=dict(showgrid=False, gridcolor=GRID_COLOR),
+    yaxis=dict(showgrid=True, gridcolor=GRID_COLOR),
+)
+POLAR_LAYOUT = dict(
+    bgcolor=TRANSPARENT,
+    radialaxis=dict(gridcolor=POLAR_GRID_COLOR),
+    angularaxis=dict(gridcolor=POLAR_GRID_COLOR, tickfont=dict(color="white"))
+)
+
+
+def register_template():
+    """'neet_dark' 템플릿 등록 (이미 있으면 그대로 둠)"""
+    if TEMPLATE in pio.templates:
+        return
+    # 기본 템플릿에서 축·polar·hover 설정만 가져옴 (긴 카테고리 라벨용 automargin 포함)
+    base = pio.templates["plotly"].layout
+    template = go.layout.Template(layout=dict(
+        xaxis=base.xaxis, yaxis=base.yaxis, hoverlabel=base.hoverlabel,
+        polar=base.polar, hovermode=base.hovermode, autotypenumbers=base.autotypenumbers,
+    ))
+    template.layout.update(
+        paper_bgcolor=TRANSPARENT,   # 전체 배경 투명
+        plot_bgcolor=TRANSPARENT,    # 플롯 배경 투명
+        font=dict(color="#e0e0e0"),  # 폰트 색상 밝게
+        title=dict(font=dict(color="#ffffff")),
+        colorway=px.colors.qualitative.Plotly,
+        margin=dict(l=20, r=20, t=40, b=20),
+        legend=dict(
+            orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1,
+            font=dict(color="white")
+        ),
+        xaxis=dict(showgrid=False, gridcolor=GRID_COLOR, automargin=True),
+        yaxis=dict(showgrid=True, gridcolor=GRID_COLOR, automargin=True),
+        polar=dict(
+            bgcolor=TRANSPARENT,
+            radialaxis=dict(gridcolor=POLAR_GRID_COLOR),
+            angularaxis=dict(gridcolor=POLAR_GRID_COLOR, tickfont=dict(color="white"))
+        ),
+    )
+    pio.templates[TEMPLATE] = template
+
+
+register_template()
+
+
+# -----------------------------------------------------------------------------
+# Figure 생성 (템플릿을 이름으로 적용 + 테마 값을 layout에 설정)
+# -----------------------------------------------------------------------------
+def _themed(fig, polar=False):
+    fig.update_layout(**THEME_LAYOUT)
+    if polar:
+        fig.update_layout(polar=POLAR_LAYOUT)
+    return fig
+
+
+def figure(*traces, polar=False, **layout):
+    """graph_objects Figure. polar=True면 레이더 차트 스타일 포함, layout 인자는 테마 값 위에 병합"""
+    fig = _themed(go.Figure(data=list(traces), layout=dict(template=TEMPLATE)), polar=polar)
+    return fig.update_layout(**layout)
+
+
+def bar(*args, **kwargs):
+    return _themed(px.bar(*args, template=TEMPLATE, **kwargs))
+
+
+def histogram(*args, **kwargs):
+    return _themed(px.histogram(*args, template=TEMPLATE, **kwargs))
+
+
+def box(*args, **kwargs):
+    return _themed(px.box(*args, template=TEMPLATE, **kwargs))
+
+
+def pie(*args, **kwargs):
+    return _themed(px.pie(*args, template=TEMPLATE, **kwargs))
+
+
+def line_polar(*args, **kwargs):
+    return _themed(px.line_polar(*args, template=TEMPLATE, **kwargs), polar=True)
+
+
+def scatter_mapbox(*args, **kwargs):
+    return _themed(px.scatter_mapbox(*args, template=TEMPLATE, **kwargs))
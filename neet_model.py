@@ -0,0 +1,222 @@
+"""취업 성공(got_job_flag) 예측 모델.
+
+L2 정규화 로지스틱 회귀를 NumPy/SciPy로 직접 학습합니다.
+
+- 특성: 진로 심리 점수 4개, 자아효능감, log(금융자산+1)(+ 결측 여부),
+  활동경험·학력·건강·구직경로 원-핫
+- 원-핫 범주는 학습 시 한 번 정해 모델에 저장하고, 학습용 설계 행렬은 희소 행렬(CSR)
+- 점수 계산은 희소 행렬도 만들지 않고 범주 코드로 계수를 모아 더하는 방식이라
+  수백만 행도 배열 연산 몇 번으로 끝납니다
+
+모델은 dict 하나이며, 앱은 fitted_model(코호트, 데이터 버전)으로 프로세스당 한 번만 학습합니다.
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+import streamlit as st
+from scipy.optimize import minimize
+from scipy.special import expit
+
+import neet_analysis as na
+
+NUMERIC_FEATURES = na.PSYCH_RADAR_COLS + ['self_efficacy']
+CATEGORICAL_FEATURES = ['exp_type', 'edu_label', 'health_label', 'search_method']
+ASSET_FEATURE = 'log_total_asset'
+TARGET = 'got_job_flag'
+
+
+# -----------------------------------------------------------------------------
+# 1. 특성 변환
+# -----------------------------------------------------------------------------
+def _numeric_block(model, df):
+    """표준화된 수치 특성 (n, k). 결측치는 평균(=0)으로 대체하고 자산 결측 여부 열을 추가"""
+    amount = pd.to_numeric(df['total_asset_amount'], errors='coerce').to_numpy(dtype=float)
+    log_asset = np.log1p(np.clip(amount, 0, None))
+    values = np.column_stack([df[NUMERIC_FEATURES].to_numpy(dtype=float), log_asset])
+
+    scaled = (values - model['means']) / model['scales']
+    scaled[np.isnan(scaled)] = 0.0
+    return np.column_stack([scaled, np.isnan(log_asset).astype(float)])
+
+
+def _category_codes(model, df):
+    """범주형 특성별 원-핫 열 번호 (n, c). 학습 때 없던 값/결측은 -1"""
+    codes = np.empty((len(df), len(CATEGORICAL_FEATURES)), dtype=np.int64)
+    offset = model['n_numeric']
+    for j, col in enumerate(CATEGORICAL_FEATURES):
+        categories = model['categories'][col]
+        col_codes = pd.Categorical(df[col].astype(object), categories=categories).codes.astype(np.int64)
+        codes[:, j] = np.where(col_codes >= 0, col_codes + offset, -1)
+        offset += len(categories)
+    return codes
+
+
+def design_matrix(model, df):
+    """학습용 CSR 설계 행렬 (절편 제외)"""
+    numeric = _numeric_block(model, df)
+    codes = _category_codes(model, df)
+    n, k = numeric.shape
+
+    rows = np.concatenate([np.repeat(np.arange(n), k), np.repeat(np.arange(n), codes.shape[1])])
+    cols = np.concatenate([np.tile(np.arange(k), n), codes.ravel()])
+    vals = np.concatenate([numeric.ravel(), np.ones(codes.size)])
+    keep = cols >= 0
+    return sp.csr_matrix((vals[keep], (rows[keep], cols[keep])), shape=(n, model['n_features']))
+
+
+# -----------------------------------------------------------------------------
+# 2. 학습
+# -----------------------------------------------------------------------------
+def _init_model(df):
+    """표준화 통계와 원-핫 범주(= 특성 이름 순서)를 정합니다."""
+    amount = pd.to_numeric(df['total_asset_amount'], errors='coerce').to_numpy(dtype=float)
+    values = np.column_stack([df[NUMERIC_FEATURES].to_numpy(dtype=float), np.log1p(np.clip(amount, 0, None))])
+    means = np.nanmean(values, axis=0)
+    scales = np.nanstd(values, axis=0)
+    scales[~(scales > 0)] = 1.0
+
+    categories = {}
+    feature_names = NUMERIC_FEATURES + [ASSET_FEATURE, f'{ASSET_FEATURE}_missing']
+    for col in CATEGORICAL_FEATURES:
+        series = df[col]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            cats = [c for c in series.cat.categories if (series == c).any()]
+        else:
+            cats = sorted(series.dropna().unique().tolist())
+        categories[col] = cats
+        feature_names += [f'{col}={c}' for c in cats]
+
+    n_numeric = len(NUMERIC_FEATURES) + 2
+    return {
+        'means': means, 'scales': scales, 'categories': categories,
+        'feature_names': feature_names, 'n_numeric': n_numeric,
+        'n_features': len(feature_names),
+    }
+
+
+def _auc(y, p):
+    """Mann-Whitney U 기반 ROC AUC"""
+    ranks = pd.Series(p).rank().to_numpy()
+    n_pos = y.sum()
+    n_neg = len(y) - n_pos
+    if n_pos == 0 or n_neg == 0:
+        return float('nan')
+    return float((ranks[y == 1].sum() - n_pos * (n_pos + 1) / 2) / (n_pos * n_neg))
+
+
+def fit_model(df, alpha=1.0):
+    """L2 정규화 로지스틱 회귀 학습. alpha는 (절편 제외) 계수의 L2 벌점 세기"""
+    df = df.dropna(subset=[TARGET])
+    model = _init_model(df)
+    X = design_matrix(model, df)
+    y = df[TARGET].to_numpy(dtype=float)
+    n = len(y)
+
+    def loss_and_grad(params):
+        w, b = params[:-1], params[-1]
+        z = X @ w + b
+        loss = np.logaddexp(0, z).sum() / n - (y @ z) / n + 0.5 * alpha / n * (w @ w)
+        residual = (expit(z) - y) / n
+        grad_w = X.T @ residual + alpha / n * w
+        return loss, np.append(grad_w, residual.sum())
+
+    result = minimize(loss_and_grad, np.zeros(model['n_features'] + 1), jac=True, method='L-BFGS-B')
+
+    model['coef'] = result.x[:-1]
+    model['intercept'] = float(result.x[-1])
+    model['alpha'] = alpha
+    model['train'] = dict(evaluate(model, df), converged=bool(result.success))
+    return model
+
+
+def evaluate(model, df):
+    """df에 대한 표본 수·취업률·정확도(0.5 기준)·AUC"""
+    df = df.dropna(subset=[TARGET])
+    y = df[TARGET].to_numpy(dtype=float)
+    p = predict_proba(model, df)
+    return {
+        'n': len(y),
+        'base_rate': float(y.mean()) if len(y) else float('nan'),
+        'accuracy': float(((p >= 0.5) == (y == 1)).mean()) if len(y) else float('nan'),
+        'auc': _auc(y, p),
+    }
+
+
+def fit_with_holdout(df, alpha=1.0, holdout=0.2, seed=0):
+    """holdout 비율만큼 떼어 낸 검증 표본으로 성능을 재고, 최종 모델은 전체 데이터로 학습.
+
+    검증 지표는 model['holdout']에 저장합니다 (model['train']은 학습 데이터 기준).
+    """
+    df = df.dropna(subset=[TARGET])
+    is_test = np.random.default_rng(seed).random(len(df)) < holdout
+    model = fit_model(df, alpha)
+    model['holdout'] = evaluate(fit_model(df[~is_test], alpha), df[is_test])
+    return model
+
+
+# -----------------------------------------------------------------------------
+# 3. 점수 계산 (배치)
+# -----------------------------------------------------------------------------
+def predict_proba(model, df):
+    """응답자별 취업 성공 확률 (n,). 원-핫 부분은 계수 조회(gather)로 계산"""
+    coef = model['coef']
+    logit = _numeric_block(model, df) @ coef[:model['n_numeric']] + model['intercept']
+
+    codes = _category_codes(model, df)
+    # -1(미등록 범주)은 기여도 0인 맨 끝 슬롯을 가리키도록
+    padded = np.append(coef, 0.0)
+    logit += padded[np.where(codes >= 0, codes, len(coef))].sum(axis=1)
+    return expit(logit)
+
+
+def score_batch(model, df, chunk_size=1_000_000):
+    """대용량 패널 점수 계산. 메모리를 제한하기 위해 chunk_size행씩 나눠 처리"""
+    if len(df) <= chunk_size:
+        return predict_proba(model, df)
+    return np.concatenate([
+        predict_proba(model, df.iloc[start:start + chunk_size])
+        for start in range(0, len(df), chunk_size)
+    ])
+
+
+def coefficients(model):
+    """특성별 계수 표 (절댓값 내림차순)"""
+    table = pd.DataFrame({'feature': model['feature_names'], 'coef': model['coef']})
+    return table.reindex(table['coef'].abs().sort_values(ascending=False).index).reset_index(drop=True)
+
+
+# -----------------------------------------------------------------------------
+# 4. 캐시 (데이터 버전별 1회 학습)
+# -----------------------------------------------------------------------------
+@st.cache_resource(max_entries=8)
+def fitted_model(cohort, data_version, alpha=1.0):
+    """코호트 전체 데이터로 학습. data_version(na.data_version(cohort))이 바뀔 때만 다시 학습
+
+    load_data 캐시는 scope만 키로 쓰므로 데이터가 바뀌어도 예전 DataFrame을 돌려줍니다.
+    학습은 파일에서 직접 읽어(read_scope) 새 버전의 데이터로 하고, 예전 버전의 모델은
+    max_entries에 따라 밀려납니다.
+    """
+    return fit_with_holdout(na.read_scope(na.make_scope(cohort)), alpha)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="대시보드 데이터로 모델을 학습하고 패널 응답자 파일에 확률을 붙입니다.")
+    parser.add_argument("input", help="전처리된 응답자 CSV (neet_data.py 출력과 같은 컬럼)")
+    parser.add_argument("output", help="p_got_job 컬럼을 추가해 저장할 CSV")
+    parser.add_argument("--alpha", type=float, default=1.0, help="L2 벌점 세기")
+    parser.add_argument("--cohort", default=None, help="학습에 사용할 코호트 (기본: 최신)")
+    args = parser.parse_args()
+
+    scope = na.make_scope(args.cohort) if args.cohort else na.default_scope()
+    model = fit_with_holdout(na.read_scope(scope), args.alpha)
+    panel = pd.read_csv(args.input)
+
+    start = time.perf_counter()
+    panel['p_got_job'] = score_batch(model, panel)
+    elapsed = time.perf_counter() - start
+
+    panel.to_csv(args.output, index=False, encoding="utf-8-sig")
+    print(f"{len(panel):,}명 점수 계산 {elapsed:.2f} s (검증 AUC {model['holdout']['auc']:.3f}) → {args.output}")
@@ -0,0 +1,90 @@
+"""모든 세션이 함께 쓰는 계산 결과 캐시.
+
+같은 화면 상태(코호트·지역 필터·선택 지역 — URL 쿼리 파라미터로 표현되는 값)에서
+나온 결과는 누가 요청하든 같으므로, 프로세스당 하나뿐인 캐시(st.cache_resource)에
+보관해 인기 있는 화면을 모든 세션에 메모리에서 바로 돌려줍니다.
+
+- 크기 제한(LRU)과 유효 시간(TTL)이 있어 오래된/드문 화면은 자동으로 빠집니다.
+- hit/miss/eviction 카운터로 캐시 효과를 확인할 수 있습니다 (사이드바 '캐시 상태').
+- st.cache_data와 달리 값을 복사하지 않고 같은 객체를 돌려주므로,
+  호출한 쪽에서 결과(Figure, DataFrame)를 수정하면 안 됩니다.
+"""
+import functools
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import streamlit as st
+
+MAX_ENTRIES = int(os.environ.get("NEET_RESULT_CACHE_SIZE", 512))
+TTL_SECONDS = float(os.environ.get("NEET_RESULT_CACHE_TTL", 3600))
+
+
+class ResultCache:
+    """스레드 안전 LRU + TTL 캐시"""
+
+    def __init__(self, max_entries=MAX_ENTRIES, ttl=TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()  # key -> (저장 시각, 값)
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key, compute):
+        """key가 있고 만료 전이면 저장된 값, 아니면 compute()를 실행해 저장"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[0] < self.ttl:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        # 계산은 잠금 밖에서 (동시에 같은 key가 들어오면 중복 계산될 수 있지만 결과는 같음)
+        value = compute()
+
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            requests = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'ttl_s': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / requests if requests else 0.0,
+            }
+
+
+@st.cache_resource
+def get_result_cache():
+    """서버 프로세스에 하나뿐인 ResultCache"""
+    return ResultCache()
+
+
+def shared_result(func):
+    """함수 결과를 (함수 이름, 인자) 키로 공유 캐시에 보관하는 데코레이터. 인자는 hashable이어야 함"""
+    name = f"{func.__module__}.{func.__qualname__}"
+
+    @functools.wraps(func)
+    def wrapper(*args):
+        return get_result_cache().get_or_compute((name,) + args, lambda: func(*args))
+
+    return wrapper
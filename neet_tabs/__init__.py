@@ -0,0 +1,24 @@
+"""대시보드 탭 모듈.
+
+각 모듈은 render(df, scope) 하나만 공개합니다. 앱은 선택된 탭의 모듈만 import하므로
+plotly 같은 무거운 의존성은 해당 탭을 처음 그릴 때 로드됩니다.
+"""
+import importlib
+
+# 탭 제목 → neet_tabs 하위 모듈 이름 (표시 순서)
+TABS = {
+    "🧠 진로 심리": "psych",
+    "🗺️ 인터랙티브 지도": "region_map",
+    "🔎 구직 경로": "search",
+    "😫 어려움 Top 5": "difficulty",
+    "👫 인구 및 자산통계": "demographics",
+    "🏫 학력/지역": "edu_region",
+    "💪 건강": "health",
+    "🤖 취업 예측": "prediction",
+}
+
+
+def render_tab(title, df, scope):
+    """탭 모듈을 (처음이면) import하고 화면을 그립니다."""
+    module = importlib.import_module(f"{__name__}.{TABS[title]}")
+    module.render(df, scope)
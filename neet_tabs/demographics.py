@@ -0,0 +1,60 @@
+"""TAB 5: 인구통계 및 금융자산"""
+import streamlit as st
+
+import neet_analysis as na
+
+
+def render(df, scope):
+    import neet_charts as charts
+
+    st.subheader("👫 성별 및 나이 분포")
+    c1, c2 = st.columns(2)
+
+    with c1:
+        st.plotly_chart(charts.gender_figure(scope), use_container_width=True)
+
+    with c2:
+        st.plotly_chart(charts.age_gender_figure(scope), use_container_width=True)
+
+    st.divider()
+    st.subheader("💰 금융자산 규모와 취업 성공의 관계")
+    st.caption("단순한 자산 보유 여부를 넘어, **금융자산 총액(y01f508)**이 취업 성과와 어떤 상관관계를 보이는지 분석합니다.")
+
+    if 'total_asset_amount' not in df.columns:
+        st.error("⚠️ 'total_asset_amount' 데이터가 없습니다. data_preprocessing.py를 실행하여 데이터를 갱신해주세요.")
+        return
+
+    # (1) 취업 여부별 평균 자산액 / (2) 자산 구간별 취업 성공률
+    avg_asset_by_job, job_rate_by_asset_group = na.asset_group_rates(scope)
+
+    # 2. 차트 그리기 (디자인 통일)
+    c1, c2 = st.columns(2)
+
+    with c1:
+        st.markdown("##### 1️⃣ 취업 상태별 평균 자산액")
+        st.plotly_chart(charts.asset_avg_figure(scope), use_container_width=True)
+
+    with c2:
+        st.markdown("##### 2️⃣ 자산 규모별 취업 성공률")
+        st.plotly_chart(charts.asset_rate_figure(scope), use_container_width=True)
+
+    # 3. 인사이트 텍스트
+    try:
+        val_emp = avg_asset_by_job.loc[avg_asset_by_job['outcome'] == '취업 성공', 'amount'].values[0]
+        val_unemp = avg_asset_by_job.loc[avg_asset_by_job['outcome'] == '미취업', 'amount'].values[0]
+        diff = val_emp - val_unemp
+        comparison = "많습니다" if diff > 0 else "적습니다"
+
+        # 자산 없음 vs 고자산 취업률 차이
+        rate_no_asset = job_rate_by_asset_group.loc[0, 'rate']
+        rate_high_asset = job_rate_by_asset_group.iloc[-1]['rate']
+
+        st.info(
+            f"💡 **분석 결과:** \n"
+            f"- **취업자 자산 우위:** 취업 성공 그룹의 평균 자산은 **{int(val_emp):,}만원**으로, "
+            f"미취업 그룹({int(val_unemp):,}만원)보다 약 **{abs(int(diff)):,}만원 {comparison}**.\n"
+            f"- **자산과 취업률:** 자산이 없는 그룹의 취업률(**{rate_no_asset}%**)보다 "
+            f"2,000만원 이상 자산 보유 그룹의 취업률(**{rate_high_asset}%**)이 더 높게 나타납니다."
+        )
+    except (IndexError, ValueError):
+        st.warning("데이터가 충분하지 않아 인사이트를 생성할 수 없습니다.")
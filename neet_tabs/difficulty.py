@@ -0,0 +1,9 @@
+"""TAB 4: 어려움 Top 5 (Clean Bar)"""
+import streamlit as st
+
+
+def render(df, scope):
+    import neet_charts as charts
+
+    st.subheader("😫 구직 중 가장 큰 장벽은?")
+    st.plotly_chart(charts.difficulty_figure(scope), use_container_width=True)
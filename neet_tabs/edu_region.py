@@ -0,0 +1,13 @@
+"""TAB 6: 학력 및 지역"""
+import streamlit as st
+
+
+def render(df, scope):
+    import neet_charts as charts
+
+    st.subheader("🏫 학력과 거주지")
+    c1, c2 = st.columns(2)
+    with c1:
+        st.plotly_chart(charts.edu_figure(scope), use_container_width=True)
+    with c2:
+        st.plotly_chart(charts.region_distribution_figure(scope), use_container_width=True)
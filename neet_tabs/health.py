@@ -0,0 +1,9 @@
+"""TAB 7: 건강"""
+import streamlit as st
+
+
+def render(df, scope):
+    import neet_charts as charts
+
+    st.subheader("💪 건강 상태와 취업")
+    st.plotly_chart(charts.health_figure(scope), use_container_width=True)
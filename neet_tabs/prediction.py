@@ -0,0 +1,47 @@
+"""TAB 8: 취업 예측 (What-if)"""
+import pandas as pd
+import streamlit as st
+
+import neet_analysis as na
+
+
+def render(df, scope):
+    import neet_model as nm
+
+    st.subheader("🤖 조건을 바꾸면 취업 가능성은?")
+    st.caption("진로 심리·자아효능감·활동경험·학력·건강·구직경로·금융자산으로 학습한 "
+               "로지스틱 회귀 모델입니다. 인과 관계가 아닌 상관 관계를 보여줍니다.")
+
+    model = nm.fitted_model(scope.cohort, na.data_version(scope.cohort))
+    train = model['train']
+
+    # 평균적인 응답자를 기본값으로 사용
+    defaults = df[nm.NUMERIC_FEATURES].mean()
+    categories = model['categories']
+
+    col_input, col_result = st.columns([1, 1])
+
+    with col_input:
+        profile = {}
+        for col, label in zip(na.PSYCH_RADAR_COLS, na.PSYCH_RADAR_CATEGORIES):
+            profile[col] = st.slider(label, 1.0, 5.0, round(float(defaults[col]), 1), 0.1)
+        profile['self_efficacy'] = st.slider("자아효능감", 1.0, 5.0, round(float(defaults['self_efficacy']), 1), 0.1)
+
+        c1, c2 = st.columns(2)
+        profile['exp_type'] = c1.selectbox("활동경험", categories['exp_type'])
+        profile['edu_label'] = c2.selectbox("학력", categories['edu_label'])
+        profile['health_label'] = c1.selectbox("건강 상태", categories['health_label'])
+        profile['search_method'] = c2.selectbox("구직정보 취득 경로", categories['search_method'])
+        profile['total_asset_amount'] = st.number_input("금융자산 총액 (만원)", min_value=0, value=0, step=100)
+
+    with col_result:
+        prob = nm.predict_proba(model, pd.DataFrame([profile]))[0] * 100
+        base = train['base_rate'] * 100
+        st.metric("예상 취업 성공 확률", f"{prob:.1f}%", delta=f"{prob - base:+.1f}%p (전체 평균 대비)")
+        holdout = model['holdout']
+        st.caption(f"학습 표본 {train['n']:,}명 · 검증 표본({holdout['n']:,}명, 학습에서 제외) 기준 "
+                   f"정확도 {holdout['accuracy'] * 100:.1f}% · AUC {holdout['auc']:.3f}  \n"
+                   f"학습 데이터 기준 정확도 {train['accuracy'] * 100:.1f}% · AUC {train['auc']:.3f}")
+
+        st.markdown("##### 영향이 큰 요인 (로지스틱 회귀 계수, 수치형은 표준화)")
+        st.dataframe(nm.coefficients(model).head(10), use_container_width=True, hide_index=True)
@@ -0,0 +1,32 @@
+"""TAB 1: 진로 심리 (Radar Chart)"""
+import streamlit as st
+
+
+def render(df, scope):
+    import neet_charts as charts
+
+    st.subheader("💡 심리적 요인과 진로 발달")
+    col_radar, col_desc = st.columns([1, 1])
+
+    with col_radar:
+        st.plotly_chart(charts.psych_radar_figure(scope), use_container_width=True)
+
+    with col_desc:
+        st.markdown("""
+        > **인사이트** > **취업 성공 그룹(초록색)**은 상대적으로 **'진로 계획 명확성'**이 높고, 
+        > **미취업 그룹(빨간색)**은 **'결정 어려움'**과 **'불확실성'** 수치가 넓게 분포합니다.
+        > 
+        > 즉, *스킬보다 방향성* 설정이 NEET 탈출의 핵심일 수 있습니다.
+        """)
+
+        # 박스플롯 3개 작은 사이즈로
+        sub_c1, sub_c2, sub_c3 = st.columns(3)
+        with sub_c1:
+            st.caption("① 계획 명확성")
+            st.plotly_chart(charts.psych_box_figure(scope, "avg_career_plan_score"), use_container_width=True)
+        with sub_c2:
+            st.caption("② 결정 어려움")
+            st.plotly_chart(charts.psych_box_figure(scope, "avg_trouble_deciding_career"), use_container_width=True)
+        with sub_c3:
+            st.caption("③ 불확실성")
+            st.plotly_chart(charts.psych_box_figure(scope, "avg_uncertain_decision_pending"), use_container_width=True)
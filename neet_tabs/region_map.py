@@ -0,0 +1,100 @@
+"""TAB 2: 지도 (Interactive Map) + 지역 상세 분석"""
+import streamlit as st
+
+import neet_analysis as na
+from neet_view import set_selected_region
+
+
+def _clear_selection():
+    """상세 분석 닫기: URL의 지역과 지도 선택 상태를 함께 지움"""
+    set_selected_region(None)
+    st.session_state.pop("_map_last_click", None)
+    st.session_state.pop("region_map", None)
+
+
+def render(df, scope):
+    import neet_charts as charts
+
+    st.subheader("🗺️ 지역별 심층 분석 (Interactive Map)")
+    st.caption("👇 지도 위의 원을 클릭하면 하단에 상세 분석 리포트가 펼쳐집니다.")
+
+    # -------------------------------------------------------------------------
+    # 1. 지도 그리기 (지역 집계는 neet_analysis.region_table에서 캐시)
+    # -------------------------------------------------------------------------
+    plot_df = na.map_points(scope)
+
+    if not plot_df.empty:
+        # 클릭 이벤트 감지
+        event = st.plotly_chart(
+            charts.region_map_figure(scope),
+            key="region_map",
+            use_container_width=True,
+            on_select="rerun",
+            selection_mode="points"
+        )
+    else:
+        st.warning("지도 데이터가 없습니다.")
+        event = None
+
+    # -------------------------------------------------------------------------
+    # 2. 클릭 시 상세 분석 로직
+    # -------------------------------------------------------------------------
+    selected_region = None
+
+    # 이 차트에서 새 지역을 클릭했을 때만 URL에 기록해 같은 화면을 링크로 열 수 있게.
+    # 다른 탭에 다녀오면 차트 선택 상태가 사라져 event가 비어 돌아오므로,
+    # 빈 선택을 '해제'로 보지 않고 마지막으로 클릭한 지역과 비교합니다.
+    if event and event['selection']['points']:
+        idx = event['selection']['points'][0]['point_index']
+        clicked_region = plot_df.iloc[idx]['region_label']
+        if clicked_region != st.session_state.get("_map_last_click"):
+            st.session_state["_map_last_click"] = clicked_region
+            set_selected_region(clicked_region)
+
+    # 선택 지역은 URL(?region=서울)이 기준
+    if st.query_params.get("region") in set(plot_df['region_label']):
+        selected_region = st.query_params["region"]
+
+    if not selected_region:
+        return
+
+    st.divider()
+    col_title, col_clear = st.columns([5, 1])
+    col_title.markdown(f"### 🔍 [{selected_region}] 지역 상세 분석")
+    col_clear.button("선택 해제", on_click=_clear_selection, use_container_width=True)
+
+    report = na.region_report(scope.cohort, selected_region)
+    metrics = report['metrics']
+
+    # 🔹 [Section 1] 핵심 지표 카드
+    # (CSS 스타일이 적용된 Metric 카드)
+    c1, c2, c3, c4, c5 = st.columns(5)
+    c1.metric("대상 인원", f"{metrics['대상 인원']}명")
+    c2.metric("취업 성공률", f"{metrics['취업 성공률']}%")
+    c3.metric("자아효능감(5점 만점)", f"{metrics['자아효능감']}점")
+    c4.metric("진로계획 명확성(5점 만점)", f"{metrics['진로계획 명확성']}점")
+    c5.metric("일 경험률", f"{metrics['일 경험률']}%")
+
+    st.write("")  # 여백
+
+    # 🔹 [Section 2] 일 경험률 상세 (Toggle & Pie Chart)
+    show_exp = st.toggle("🔍 일 경험률 상세 보기", value=False)
+
+    if show_exp:
+        st.markdown("##### 🥧 활동경험 분포")
+        st.plotly_chart(charts.region_pie_figure(scope.cohort, selected_region), use_container_width=True)
+
+    st.divider()
+
+    # 🔹 [Section 3] 레이더 차트 (지역 vs 전국 평균)
+    col_radar_chart, col_radar_text = st.columns([2, 1])
+
+    with col_radar_chart:
+        st.markdown("#### 🕸️ 지역 강점/약점 분석 (전국 평균=100 기준)")
+        st.plotly_chart(charts.region_radar_figure(scope.cohort, selected_region), use_container_width=True)
+
+    # 🔹 [Section 4] 자동 분석 텍스트
+    with col_radar_text:
+        st.markdown("<br><br>", unsafe_allow_html=True)  # 줄바꿈으로 위치 조정
+
+        st.info(na.region_insight_text(report))
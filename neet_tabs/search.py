@@ -0,0 +1,18 @@
+"""TAB 3: 구직 경로"""
+import streamlit as st
+
+
+def render(df, scope):
+    st.subheader("📢 어떻게 일자리를 찾았을까?")
+
+    if 'search_method' not in df.columns:
+        return
+
+    import neet_charts as charts
+
+    c1, c2 = st.columns([1, 1])
+    with c1:
+        st.plotly_chart(charts.search_count_figure(scope), use_container_width=True)
+
+    with c2:
+        st.plotly_chart(charts.search_success_figure(scope), use_container_width=True)
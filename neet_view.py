@@ -0,0 +1,68 @@
+"""URL 쿼리 파라미터(st.query_params) ↔ 화면 상태.
+
+화면 상태를 URL에 담아 링크로 같은 화면을 열 수 있게 하고,
+같은 상태의 계산 결과를 세션 간에 공유하는 기준으로 씁니다.
+
+    ?tab=region_map&cohort=YP2021&regions=서울,부산&region=서울
+
+- tab     : 선택된 탭 (neet_tabs.TABS의 모듈 이름)
+- cohort  : 코호트
+- regions : 사이드바 지역 필터 (쉼표 구분, 없으면 전체)
+- region  : 지도에서 선택한 상세 분석 지역
+"""
+import streamlit as st
+
+import neet_analysis as na
+from neet_tabs import TABS
+
+TAB_TITLES = {slug: title for title, slug in TABS.items()}
+
+
+def read_view():
+    """쿼리 파라미터 → 상태 dict (알 수 없는 값은 None)"""
+    params = st.query_params
+    regions = [r for r in params.get("regions", "").split(",") if r in na.REGION_COORDS]
+    region = params.get("region")
+    return {
+        'tab': TAB_TITLES.get(params.get("tab")),
+        'cohort': params.get("cohort") if params.get("cohort") in na.available_cohorts() else None,
+        'regions': regions,
+        'region': region if region in na.REGION_COORDS else None,
+    }
+
+
+def seed_widgets(view):
+    """세션의 첫 실행에서만 URL 상태로 위젯 값을 채웁니다 (이후에는 사용자가 바꾼 값 유지)."""
+    cohorts = na.available_cohorts()
+    defaults = {
+        'cohort': view['cohort'] or cohorts[-1],
+        'regions': view['regions'],
+        'active_tab': view['tab'] or next(iter(TABS)),
+    }
+    for key, value in defaults.items():
+        if key not in st.session_state:
+            st.session_state[key] = value
+
+
+def write_view(tab, cohort, regions):
+    """현재 위젯 값을 URL에 반영. 선택 지역(region)은 지도 탭이 직접 관리합니다."""
+    updates = {
+        'tab': TABS[tab],
+        'cohort': cohort,
+        'regions': ",".join(regions) if regions else None,
+    }
+    for key, value in updates.items():
+        if value is None:
+            if key in st.query_params:
+                del st.query_params[key]
+        elif st.query_params.get(key) != value:
+            st.query_params[key] = value
+
+
+def set_selected_region(region):
+    """지도에서 고른 지역을 URL에 기록 (None이면 제거)"""
+    if region is None:
+        if "region" in st.query_params:
+            del st.query_params["region"]
+    elif st.query_params.get("region") != region:
+        st.query_params["region"] = region
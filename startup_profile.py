@@ -0,0 +1,164 @@
+"""앱 시작 시간 프로파일러.
+
+두 가지를 측정합니다.
+- import 비용: 새 인터프리터에서 `python -X importtime`으로 앱을 한 번 실행하고
+  stderr의 import time 표를 파싱해 최상위 패키지별 누적 시간을 집계
+- 단계별 wall-clock: 앱이 mark()로 남긴 시점(페이지 설정, 데이터 로드,
+  헤더 출력 = first paint, 탭 렌더링)을 스크립트 시작 기준으로 보고
+
+    $ python startup_profile.py                 # 기본(첫 번째) 탭, 두 설정 모두
+    $ python startup_profile.py --runs 5 --top 20
+    $ python startup_profile.py --config default
+
+설정(--config, 기본은 둘 다)
+- default    : 배포 설정 그대로. 첫 실행과 동시에 백그라운드 warm-up 스레드가
+               plotly/scipy를 import하고 차트를 만들므로 first paint가 그 경합을 포함합니다.
+               warm-up이 끝날 때까지 기다려 'warmup_end' 단계로 보고하므로
+               process wall-clock과 import 표에도 warm-up이 포함됩니다.
+- no-warmup  : NEET_WARMUP=0. 스크립트 자체의 import/렌더링 비용만
+
+Streamlit 서버 없이 bare 모드로 실행하므로 브라우저 렌더링 시간은 포함되지 않습니다.
+앱은 mark()만 사용하므로, 이 모듈은 표준 라이브러리 외에는 import하지 않습니다.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+FIRST_PAINT_PHASE = "header"
+
+# reset()이 불리기 전(=일반 서버 실행)에는 mark()가 아무것도 기록하지 않습니다.
+_enabled = False
+_t0 = time.perf_counter()
+_phases = []
+
+
+def reset():
+    """측정을 켜고 기준 시점을 지금으로 다시 잡습니다."""
+    global _enabled, _t0
+    _enabled = True
+    _t0 = time.perf_counter()
+    _phases.clear()
+
+
+def mark(phase):
+    """기준 시점부터 현재까지의 경과 시간(초)을 phase 이름으로 기록"""
+    if _enabled:
+        _phases.append((phase, time.perf_counter() - _t0))
+
+
+def phases():
+    return list(_phases)
+
+
+# -----------------------------------------------------------------------------
+# 측정 (자식 프로세스)
+# -----------------------------------------------------------------------------
+_BOOTSTRAP = """
+import json, runpy, sys, threading
+import startup_profile
+startup_profile.reset()
+runpy.run_path({app!r}, run_name="__main__")
+startup_profile.mark("script_end")
+warmups = [t for t in threading.enumerate() if t.name == "neet-cache-warmup"]
+for thread in warmups:
+    thread.join()
+if warmups:
+    startup_profile.mark("warmup_end")
+sys.stdout.write("\\n" + {marker!r} + json.dumps(startup_profile.phases()) + "\\n")
+"""
+_MARKER = "__STARTUP_PHASES__"
+
+
+def parse_importtime(stderr):
+    """-X importtime 출력 → {최상위 패키지: 누적 시간(us)}
+
+    import time 표에서 들여쓰기가 없는 줄이 최상위 import이며,
+    cumulative 값에 하위 import가 모두 포함됩니다.
+    """
+    totals = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        try:
+            _, cumulative, name = line[len("import time:"):].split("|")
+            cumulative = int(cumulative)
+        except ValueError:
+            continue
+        if name.startswith("  "):  # 하위 import는 부모의 cumulative에 이미 포함
+            continue
+        package = name.strip().split(".")[0]
+        totals[package] = totals.get(package, 0) + cumulative
+    return totals
+
+
+CONFIGS = {'default': "1", 'no-warmup': "0"}  # 설정 이름 → NEET_WARMUP
+
+
+def profile_once(app="streamlit_app.py", config="default"):
+    """앱을 새 프로세스에서 한 번 실행 → (전체 wall-clock 초, import 표, 단계 목록)"""
+    env = dict(os.environ, NEET_WARMUP=CONFIGS[config])
+    cmd = [sys.executable, "-X", "importtime", "-c", _BOOTSTRAP.format(app=app, marker=_MARKER)]
+
+    start = time.perf_counter()
+    proc = subprocess.run(cmd, capture_output=True, text=True, env=env,
+                          cwd=os.path.dirname(os.path.abspath(__file__)))
+    wall = time.perf_counter() - start
+
+    if _MARKER not in proc.stdout:
+        raise RuntimeError(f"앱 실행 실패 (exit {proc.returncode}):\n{proc.stderr[-2000:]}")
+    phase_list = json.loads(proc.stdout.rsplit(_MARKER, 1)[1])
+    return wall, parse_importtime(proc.stderr), phase_list
+
+
+def profile(app, config, runs):
+    """runs번 실행 → (wall-clock 목록, {패키지: us 목록}, {단계: 초 목록})"""
+    walls, imports, phase_runs = [], {}, {}
+    for _ in range(runs):
+        wall, import_totals, phase_list = profile_once(app, config)
+        walls.append(wall)
+        for package, us in import_totals.items():
+            imports.setdefault(package, []).append(us)
+        for phase, elapsed in phase_list:
+            phase_runs.setdefault(phase, []).append(elapsed)
+    return walls, imports, phase_runs
+
+
+def print_report(config, runs, top, walls, imports, phase_runs):
+    print(f"== cold start [{config}] ({runs} runs, median) ==")
+    print(f"process wall-clock        {statistics.median(walls) * 1000:9.1f} ms")
+    if FIRST_PAINT_PHASE in phase_runs:
+        print(f"time to first paint       {statistics.median(phase_runs[FIRST_PAINT_PHASE]) * 1000:9.1f} ms")
+
+    print("\n== phases (script start 기준 누적) ==")
+    for phase, values in phase_runs.items():
+        print(f"{phase:<25} {statistics.median(values) * 1000:9.1f} ms")
+
+    ranked = sorted(imports.items(), key=lambda item: statistics.median(item[1]), reverse=True)
+    print(f"\n== top {top} imports (cumulative) ==")
+    for package, values in ranked[:top]:
+        print(f"{package:<25} {statistics.median(values) / 1000:9.1f} ms")
+    print(f"{'(all top-level imports)':<25} {sum(statistics.median(v) for v in imports.values()) / 1000:9.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="앱 cold start 시간(import 비용, 단계별 시간) 측정")
+    parser.add_argument("--app", default="streamlit_app.py")
+    parser.add_argument("--runs", type=int, default=3, help="반복 횟수 (중앙값 보고)")
+    parser.add_argument("--top", type=int, default=15, help="표시할 import 패키지 수")
+    parser.add_argument("--config", choices=[*CONFIGS, "both"], default="both",
+                        help="default=배포 설정(warm-up 켬), no-warmup=NEET_WARMUP=0")
+    args = parser.parse_args()
+
+    configs = list(CONFIGS) if args.config == "both" else [args.config]
+    for i, config in enumerate(configs):
+        if i:
+            print()
+        print_report(config, args.runs, args.top, *profile(args.app, config, args.runs))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,13 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from scipy.stats import ttest_ind
+
+import neet_analysis as na
+from cache_warmer import start_background_warmup
+from neet_shared_cache import get_result_cache
+from neet_tabs import TABS, render_tab
+from neet_view import read_view, seed_widgets, write_view
+from startup_profile import mark
+
+mark("imports")
 
 # -----------------------------------------------------------------------------
 # 0. 페이지 설정 (가장 먼저 실행)
@@ -13,6 +18,7 @@ st.set_page_config(
     page_icon="🧭",
     initial_sidebar_state="expanded"
 )
+mark("page_config")
 
 # -----------------------------------------------------------------------------
 # 🎨 [디자인 커스텀] CSS 주입 (배경색, 폰트, 카드 스타일)
@@ -56,19 +62,19 @@ st.markdown("""
             font-weight: 700 !important;
         }
 
-        /* 4. 탭(Tab) 스타일링 */
-        .stTabs [data-baseweb="tab-list"] {
+        /* 4. 탭 내비게이션 스타일링 (가로 라디오를 탭처럼) */
+        div[role="radiogroup"] {
             gap: 8px;
         }
-        .stTabs [data-baseweb="tab"] {
-            height: 50px;
-            white-space: pre-wrap;
+        div[role="radiogroup"] > label {
+            padding: 12px 16px;
             background-color: rgba(255, 255, 255, 0.05);
+            border: 1px solid transparent;
             border-radius: 5px;
             color: #ffffff;
             font-weight: 600;
         }
-        .stTabs [aria-selected="true"] {
+        div[role="radiogroup"] > label:has(input:checked) {
             background-color: rgba(46, 204, 113, 0.2) !important;
             border: 1px solid #2ecc71;
             color: #2ecc71 !important;
@@ -90,41 +96,26 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # -----------------------------------------------------------------------------
-# 🛠 [유틸리티] 차트 테마 통일 함수
+# 1. 데이터 로드 (+ 서버 프로세스당 1회 백그라운드 캐시 warm-up)
 # -----------------------------------------------------------------------------
-def update_chart_design(fig):
-    """모든 Plotly 차트에 다크 테마와 투명 배경을 적용"""
-    fig.update_layout(
-        paper_bgcolor="rgba(0,0,0,0)",  # 전체 배경 투명
-        plot_bgcolor="rgba(0,0,0,0)",   # 플롯 배경 투명
-        font=dict(color="#e0e0e0"),     # 폰트 색상 밝게
-        margin=dict(l=20, r=20, t=40, b=20),
-        legend=dict(
-            orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1,
-            font=dict(color="white")
-        ),
-        xaxis=dict(showgrid=False, gridcolor='rgba(255,255,255,0.1)'),
-        yaxis=dict(showgrid=True, gridcolor='rgba(255,255,255,0.1)'),
-    )
-    return fig
+start_background_warmup()
 
-# -----------------------------------------------------------------------------
-# 1. 데이터 로드
-# -----------------------------------------------------------------------------
-@st.cache_data
-def load_data():
-    try:
-        df = pd.read_csv("neet_dashboard_data.csv")
-        edu_order = ['고졸 미만', '고졸', '전문대졸', '대졸', '대학원졸']
-        health_order = ['매우 나쁨', '나쁜 편', '보통', '좋은 편', '매우 좋음']
-        df['edu_label'] = pd.Categorical(df['edu_label'], categories=edu_order, ordered=True)
-        df['health_label'] = pd.Categorical(df['health_label'], categories=health_order, ordered=True)
-        return df
-    except FileNotFoundError:
-        st.error("🚨 데이터 파일(neet_dashboard_data.csv)이 없습니다.")
-        st.stop()
+# 화면 상태(탭·코호트·지역)는 URL 쿼리 파라미터와 동기화됩니다 (링크 공유 가능).
+seed_widgets(read_view())
 
-df = load_data()
+# 사이드바 필터: 코호트 + 지역. 선택한 코호트·지역의 파티션만 읽습니다.
+with st.sidebar:
+    st.header("🔧 데이터 범위")
+    cohort = st.selectbox("코호트", na.available_cohorts(), key="cohort")
+    regions = st.multiselect("지역 (비우면 전체)", na.REGIONS, key="regions")
+scope = na.make_scope(cohort, regions)
+
+try:
+    df = na.load_data(scope)
+except FileNotFoundError:
+    st.error(f"🚨 {cohort} 데이터가 없습니다. neet_data.py로 데이터셋을 만들어주세요.")
+    st.stop()
+mark("data_loaded")
 
 # -----------------------------------------------------------------------------
 # 2. 사이트 헤더
@@ -132,7 +123,7 @@ df = load_data()
 c1, c2 = st.columns([0.8, 0.2])
 with c1:
     st.title("🚀 청년 NEET, 멈춤에서 길을 찾다")
-    st.markdown("#### : 청년패널(YP2021) 데이터를 활용한 노동시장 진입 요인 심층 분석")
+    st.markdown(f"#### : 청년패널({cohort}) 데이터를 활용한 노동시장 진입 요인 심층 분석")
 with c2:
     st.image("https://cdn-icons-png.flaticon.com/512/3063/3063822.png", width=80) # 장식용 아이콘
 
@@ -146,513 +137,37 @@ success_count = len(df[df['outcome'] == '취업 성공'])
 success_rate = (success_count / total_neet * 100) if total_neet > 0 else 0
 
 col1, col2, col3 = st.columns(3)
-col1.metric("📌 분석 대상 (2021년 NEET)", f"{total_neet:,} 명", delta="청년패널 기반")
-col2.metric("💼 진입 성공 (2~3년차)", f"{success_count:,} 명", delta=f"{success_count/total_neet*100:.1f}% 전환")
+col1.metric(f"📌 분석 대상 ({cohort[-4:]}년 NEET)", f"{total_neet:,} 명", delta="청년패널 기반")
+col2.metric("💼 진입 성공 (2~3년차)", f"{success_count:,} 명", delta=f"{success_rate:.1f}% 전환")
 col3.metric("📈 취업 성공률", f"{success_rate:.1f}%", delta_color="normal")
 
 st.markdown("<br>", unsafe_allow_html=True) # 여백 추가
 
+mark("header")  # 여기까지 그려지면 첫 화면(first paint)
+
 # -----------------------------------------------------------------------------
 # 4. 메인 탭 구성
 # -----------------------------------------------------------------------------
-tab_titles = [
-    "🧠 진로 심리", 
-    "🗺️ 인터랙티브 지도", 
-    "🔎 구직 경로", 
-    "😫 어려움 Top 5", 
-    "👫 인구 및 자산통계", 
-    "🏫 학력/지역", 
-    "💪 건강"
-]
-tabs = st.tabs(tab_titles)
-
-# 색상 팔레트 정의 (성공/실패) - 네온 느낌
-COLOR_SUCCESS = "#00E676" # Bright Green
-COLOR_FAIL = "#FF5252"    # Bright Red
-COLOR_MAP = {"취업 성공": COLOR_SUCCESS, "미취업": COLOR_FAIL}
-
-# ==============================
-# 📌 TAB 1: 진로 심리 (Radar Chart)
-# ==============================
-with tabs[0]:
-    st.subheader("💡 심리적 요인과 진로 발달")
-    col_radar, col_desc = st.columns([1, 1])
-
-    radar_cols = [
-        'avg_career_plan_score', 'avg_trouble_deciding_career',
-        'avg_uncertain_decision_pending', 'avg_aptitude_not_known'
-    ]
-    categories = ['계획 명확성', '결정 어려움', '진로 불확실성', '적성 모름']
-
-    with col_radar:
-        avg_diff = df.groupby('outcome')[radar_cols].mean().reset_index()
-        fig_radar_psych = go.Figure()
-
-        # 취업 성공 군
-        if '취업 성공' in avg_diff['outcome'].values:
-            success_vals = avg_diff[avg_diff['outcome'] == '취업 성공'][radar_cols].values[0].tolist()
-            fig_radar_psych.add_trace(go.Scatterpolar(
-                r=success_vals + [success_vals[0]], theta=categories + [categories[0]],
-                fill='toself', name='취업 성공', line_color=COLOR_SUCCESS, opacity=0.8
-            ))
-
-        # 미취업 군
-        if '미취업' in avg_diff['outcome'].values:
-            fail_vals = avg_diff[avg_diff['outcome'] == '미취업'][radar_cols].values[0].tolist()
-            fig_radar_psych.add_trace(go.Scatterpolar(
-                r=fail_vals + [fail_vals[0]], theta=categories + [categories[0]],
-                fill='toself', name='미취업', line_color=COLOR_FAIL, opacity=0.6
-            ))
-
-        fig_radar_psych.update_layout(
-            polar=dict(
-                radialaxis=dict(visible=True, range=[1, 5], showticklabels=False, gridcolor="rgba(255,255,255,0.2)"),
-                angularaxis=dict(gridcolor="rgba(255,255,255,0.2)", tickfont=dict(color="white", size=12))
-            ),
-            margin=dict(t=30, b=30)
-        )
-        st.plotly_chart(update_chart_design(fig_radar_psych), use_container_width=True)
-
-    with col_desc:
-        st.markdown("""
-        > **인사이트** > **취업 성공 그룹(초록색)**은 상대적으로 **'진로 계획 명확성'**이 높고, 
-        > **미취업 그룹(빨간색)**은 **'결정 어려움'**과 **'불확실성'** 수치가 넓게 분포합니다.
-        > 
-        > 즉, *스킬보다 방향성* 설정이 NEET 탈출의 핵심일 수 있습니다.
-        """)
-        
-        # 박스플롯 3개 작은 사이즈로
-        sub_c1, sub_c2, sub_c3 = st.columns(3)
-        common_box_opts = {"x": "outcome", "color": "outcome", 
-                           "color_discrete_map": COLOR_MAP}
-        
-        with sub_c1:
-            st.caption("① 계획 명확성")
-            fig = px.box(df, y="avg_career_plan_score", **common_box_opts)
-            fig.update_layout(showlegend=False, margin=dict(l=0,r=0,t=0,b=0), height=200)
-            st.plotly_chart(update_chart_design(fig), use_container_width=True)
-        with sub_c2:
-            st.caption("② 결정 어려움")
-            fig = px.box(df, y="avg_trouble_deciding_career", **common_box_opts)
-            fig.update_layout(showlegend=False, margin=dict(l=0,r=0,t=0,b=0), height=200)
-            st.plotly_chart(update_chart_design(fig), use_container_width=True)
-        with sub_c3:
-            st.caption("③ 불확실성")
-            fig = px.box(df, y="avg_uncertain_decision_pending", **common_box_opts)
-            fig.update_layout(showlegend=False, margin=dict(l=0,r=0,t=0,b=0), height=200)
-            st.plotly_chart(update_chart_design(fig), use_container_width=True)
-
-
-# ==============================
-# 📌 TAB 2: 지도 (Interactive Map)
-# ==============================
-with tabs[1]:
-    st.subheader("🗺️ 지역별 심층 분석 (Interactive Map)")
-    st.caption("👇 지도 위의 원을 클릭하면 하단에 상세 분석 리포트가 펼쳐집니다.")
-
-    # -------------------------------------------------------------------------
-    # 1. 데이터 집계 및 준비
-    # -------------------------------------------------------------------------
-    agg_funcs = {
-        'sampid': 'count', 
-        'got_job_flag': 'mean', 
-        'self_efficacy': 'mean', 
-        'career_plan_score': 'mean'
-    }
-    # 경험 유무 컬럼 생성
-    df['experience'] = df['exp_type'].apply(lambda x: 1 if x in ['인턴/현장실습', '아르바이트', '창업 경험'] else 0)
-    agg_funcs['experience'] = 'mean'
-
-    # 지역별 그룹화
-    map_deep_df = df.groupby('region_label', observed=False).agg(agg_funcs).reset_index()
-    
-    # 표시용 컬럼 계산
-    map_deep_df['취업 성공률(%)'] = (map_deep_df['got_job_flag'] * 100).round(1)
-    map_deep_df['자아효능감(점)'] = map_deep_df['self_efficacy'].round(2)
-    map_deep_df['진로계획 명확성(점)'] = map_deep_df['career_plan_score'].round(2)
-    map_deep_df['일 경험률(%)'] = (map_deep_df['experience'] * 100).round(1)
-    
-    # 전국 평균 계산 (비교용)
-    national_avg = map_deep_df.mean(numeric_only=True)
-
-    # 좌표 매핑
-    region_coords = {
-        '서울': [37.5665, 126.9780], '부산': [35.1796, 129.0756], '대구': [35.8714, 128.6014],
-        '인천': [37.4563, 126.7052], '광주': [35.1601, 126.8517], '대전': [36.3504, 127.3845],
-        '울산': [35.5384, 129.3114], '세종': [36.4800, 127.2890], '경기': [37.4138, 127.5183],
-        '강원': [37.8228, 128.1555], '충북': [36.6350, 127.4914], '충남': [36.5184, 126.8000],
-        '전북': [35.7175, 127.1530], '전남': [34.8161, 126.4629], '경북': [36.5783, 128.5093],
-        '경남': [35.2383, 128.6925], '제주': [33.4996, 126.5312]
-    }
-    map_deep_df['lat'] = map_deep_df['region_label'].map(lambda x: region_coords.get(x, [None, None])[0])
-    map_deep_df['lon'] = map_deep_df['region_label'].map(lambda x: region_coords.get(x, [None, None])[1])
-    
-    plot_df = map_deep_df.dropna(subset=['lat', 'lon']).reset_index(drop=True)
-
-    # -------------------------------------------------------------------------
-    # 2. 지도 그리기
-    # -------------------------------------------------------------------------
-    if not plot_df.empty:
-        fig_map = px.scatter_mapbox(
-            plot_df, 
-            lat="lat", lon="lon", 
-            size="sampid",
-            color="취업 성공률(%)",
-            color_continuous_scale="Tealgrn", # 디자인 테마에 맞춘 컬러
-            size_max=40, 
-            zoom=6,
-            center={"lat": 36.5, "lon": 127.8},
-            mapbox_style="carto-darkmatter", # 다크 모드 지도
-            hover_name="region_label",
-            hover_data={"lat":False, "lon":False, "sampid":True, "취업 성공률(%)":True}
-        )
-        fig_map.update_layout(margin={"r":0,"t":0,"l":0,"b":0}, paper_bgcolor="rgba(0,0,0,0)")
-        
-        # 클릭 이벤트 감지
-        event = st.plotly_chart(
-            fig_map, 
-            use_container_width=True, 
-            on_select="rerun", 
-            selection_mode="points"
-        )
-    else:
-        st.warning("지도 데이터가 없습니다.")
-        event = None
-
-    # -------------------------------------------------------------------------
-    # 3. 클릭 시 상세 분석 로직
-    # -------------------------------------------------------------------------
-    selected_region = None
-    
-    # 클릭된 포인트가 있는지 확인
-    if event and event['selection']['points']:
-        idx = event['selection']['points'][0]['point_index']
-        selected_region = plot_df.iloc[idx]['region_label']
-
-    if selected_region:
-        st.divider()
-        st.markdown(f"### 🔍 [{selected_region}] 지역 상세 분석")
-        
-        region_data = map_deep_df[map_deep_df['region_label'] == selected_region].iloc[0]
-
-        # 🔹 [Section 1] 핵심 지표 카드
-        # (CSS 스타일이 적용된 Metric 카드)
-        c1, c2, c3, c4, c5 = st.columns(5)
-        c1.metric("대상 인원", f"{int(region_data['sampid'])}명")
-        c2.metric("취업 성공률", f"{region_data['취업 성공률(%)']}%")
-        c3.metric("자아효능감(5점 만점)", f"{region_data['자아효능감(점)']}점")
-        c4.metric("진로계획 명확성(5점 만점)", f"{region_data['진로계획 명확성(점)']}점")
-        c5.metric("일 경험률", f"{region_data['일 경험률(%)']}%")
-        
-        st.write("") # 여백
-
-        # 🔹 [Section 2] 일 경험률 상세 (Toggle & Pie Chart)
-        show_exp = st.toggle("🔍 일 경험률 상세 보기", value=False)
-        
-        if show_exp:
-            st.markdown("##### 🥧 활동경험 분포")
-            region_subset = df[df['region_label'] == selected_region]
-            exp_counts = region_subset['exp_type'].value_counts().reindex(
-                ["인턴/현장실습", "아르바이트", "창업 경험", "기타", "경험 없음"],
-                fill_value=0
-            )
-
-            fig_pie = px.pie(
-                names=exp_counts.index,
-                values=exp_counts.values,
-                hole=0.4,
-                title=f"{selected_region} 활동경험 비율",
-                color_discrete_sequence=px.colors.sequential.Teal
-            )
-            fig_pie.update_traces(textinfo='percent+label')
-            # 파이 차트 디자인 (투명 배경)
-            fig_pie.update_layout(
-                title_font_color="#ffffff",
-                paper_bgcolor="rgba(0,0,0,0)",
-                font=dict(color="white"),
-                showlegend=True
-            )
-            st.plotly_chart(fig_pie, use_container_width=True)
-
-        st.divider()
-        
-        # 🔹 [Section 3] 레이더 차트 (지역 vs 전국 평균)
-        col_radar_chart, col_radar_text = st.columns([2, 1])
-
-        with col_radar_chart:
-            st.markdown("#### 🕸️ 지역 강점/약점 분석 (전국 평균=100 기준)")
-            
-            radar_metrics = {
-                '취업 성공률':'got_job_flag',
-                '자아효능감':'self_efficacy',
-                '진로계획':'career_plan_score',
-                '일 경험률': 'experience'
-            }
-
-            radar_r = []
-            categories = []
+# st.tabs는 보이지 않는 탭까지 매번 실행하므로, 선택된 탭 하나만 import/렌더링합니다.
+# 각 탭의 내용은 neet_tabs/ 하위 모듈에 있습니다.
+active_tab = st.radio("탭 선택", list(TABS), horizontal=True, key="active_tab",
+                      label_visibility="collapsed")
+write_view(active_tab, cohort, regions)
+if df.empty:
+    # 코호트는 있지만 선택한 지역에 응답자가 없음 → 필터만 바꾸면 되도록 페이지는 유지
+    st.warning(f"⚠️ {cohort}에는 선택한 지역({', '.join(regions)})의 응답자가 없습니다. "
+               "사이드바에서 지역 필터를 바꿔주세요.")
+else:
+    render_tab(active_tab, df, scope)
+mark("tab_rendered")
 
-            for label, col in radar_metrics.items():
-                reg = region_data[col]
-                nat = national_avg[col]
-                # 전국 평균 대비 % 계산
-                score = (reg / nat * 100) if nat > 0 else 0
-                radar_r.append(score)
-                categories.append(label)
-
-            radar_df = pd.DataFrame(dict(r=radar_r, theta=categories))
-
-            fig_radar = px.line_polar(
-                radar_df,
-                r='r', theta='theta',
-                line_close=True,
-                title=f"{selected_region} vs 전국 평균(100)"
-            )
-            
-            # 레이더 차트 디자인 (다크 모드 최적화)
-            fig_radar.update_traces(fill='toself', line_color='#00E676') # 형광 초록
-            fig_radar.update_layout(
-                title_font_color="#ffffff",
-                paper_bgcolor="rgba(0,0,0,0)",
-                plot_bgcolor="rgba(0,0,0,0)",
-                polar=dict(
-                    bgcolor="rgba(0,0,0,0)",
-                    radialaxis=dict(visible=True, gridcolor="rgba(255,255,255,0.2)", tickfont=dict(color="gray")),
-                    angularaxis=dict(gridcolor="rgba(255,255,255,0.2)", tickfont=dict(color="white", size=13))
-                ),
-                font=dict(color="white")
-            )
-            st.plotly_chart(fig_radar, use_container_width=True)
-
-        # 🔹 [Section 4] 자동 분석 텍스트
-        with col_radar_text:
-            st.markdown("<br><br>", unsafe_allow_html=True) # 줄바꿈으로 위치 조정
-            
-            max_val = max(radar_r)
-            min_val = min(radar_r)
-            max_idx = radar_r.index(max_val)
-            min_idx = radar_r.index(min_val)
-            
-            strong_point = categories[max_idx]
-            weak_point = categories[min_idx]
-
-            st.info(f"""
-            **💡 Insight**
-            
-            **{selected_region}** 지역은 전국 평균 대비
-            **'{strong_point}'** 수치가 **{max_val:.1f}**점으로 가장 우수합니다.
-            
-            반면, **'{weak_point}'** 수치는 상대적으로 보완이 필요해 보입니다.
-            """)
-# ==============================
-# 📌 TAB 3: 구직 경로
-# ==============================
-with tabs[2]:
-    st.subheader("📢 어떻게 일자리를 찾았을까?")
-    
-    if 'search_method' in df.columns:
-        search_df = df[df['search_method'] != '응답 없음']
-        
-        c1, c2 = st.columns([1, 1])
-        with c1:
-            path_counts = search_df['search_method'].value_counts().reset_index()
-            path_counts.columns = ['구직 경로', '인원수']
-            fig = px.bar(path_counts, x='인원수', y='구직 경로', orientation='h', text='인원수',
-                         color='인원수', color_continuous_scale='Bluyl')
-            fig.update_layout(yaxis={'categoryorder': 'total ascending'}, title={
-                    'text': "가장 많이 시도한 방법",
-                    'font': {'color': '#ffffff', 'size': 17} 
-                })
-            st.plotly_chart(update_chart_design(fig), use_container_width=True)
-
-        with c2:
-            method_counts = search_df['search_method'].value_counts()
-            valid_methods = method_counts[method_counts >= 5].index
-            valid_df = search_df[search_df['search_method'].isin(valid_methods)]
-            
-            path_succ = valid_df.groupby('search_method')['got_job_flag'].mean().reset_index()
-            path_succ['성공률'] = path_succ['got_job_flag'] * 100
-            path_succ = path_succ.sort_values(by='성공률', ascending=False)
-            
-            fig2 = px.bar(path_succ, x='성공률', y='search_method', orientation='h', text_auto='.1f',
-                          color='성공률', color_continuous_scale='Greens')
-            fig2.update_layout(yaxis={'categoryorder': 'total ascending'}, title={
-                    'text': "실제 성공률이 높은 방법",
-                    'font': {'color': '#ffffff', 'size': 17} 
-                })
-            st.plotly_chart(update_chart_design(fig2), use_container_width=True)
-
-# ==============================
-# 📌 TAB 4: 어려움 Top 5 (Clean Bar)
-# ==============================
-with tabs[3]:
-    st.subheader("😫 구직 중 가장 큰 장벽은?")
-    
-    diff_counts = df['main_difficulty'].value_counts().drop("해당없음", errors='ignore').head(5)
-    diff_df = pd.DataFrame({"항목": diff_counts.index, "빈도": diff_counts.values})
-    diff_df["비율"] = (diff_df["빈도"] / len(df) * 100).round(1)
-
-    fig = px.bar(diff_df, x="항목", y="비율", text="비율", color="항목",
-                 color_discrete_sequence=px.colors.qualitative.Pastel)
-    fig.update_traces(texttemplate='%{text}%', textposition='outside')
-    fig.update_layout(showlegend=False, height=500, font=dict(size=14))
-    st.plotly_chart(update_chart_design(fig), use_container_width=True)
-
-# ==============================
-# 📌 TAB 5: 인구통계
-# ==============================
-with tabs[4]:
-    st.subheader("👫 성별 및 나이 분포")
-    c1, c2 = st.columns(2)
-    
-    with c1:
-        fig = px.histogram(df, x="gender_label", color="outcome", barmode="group", text_auto=True,
-                           color_discrete_map=COLOR_MAP, title="성별 취업 성공 현황")
-        fig.update_layout(title_font_color="white")
-
-        st.plotly_chart(update_chart_design(fig), use_container_width=True)
-        
-    with c2:
-        if 'age_group' not in df.columns:
-            df['age_group'] = pd.cut(df['age'], bins=[18, 24, 29], labels=['19-24세', '25-29세'])
-        
-        grouped = df.groupby(['age_group', 'gender_label'], observed=False)['got_job_flag'].mean().reset_index()
-        grouped['rate'] = grouped['got_job_flag'] * 100
-        
-        fig2 = px.bar(grouped, x='age_group', y='rate', color='gender_label', barmode='group',
-                      text_auto='.1f', title="연령대/성별 성공률 (%)",
-                      color_discrete_map={'남성': '#29B6F6', '여성': '#FF7043'})
-        fig2.update_layout(title_font_color="white")
-
-        st.plotly_chart(update_chart_design(fig2), use_container_width=True)
-
-    st.divider()
-    st.subheader("💰 금융자산 규모와 취업 성공의 관계")
-    st.caption("단순한 자산 보유 여부를 넘어, **금융자산 총액(y01f508)**이 취업 성과와 어떤 상관관계를 보이는지 분석합니다.")
-
-    # 1. 데이터 준비 (유효한 자산 데이터만 필터링)
-    if 'total_asset_amount' in df.columns:
-        # NaN(무응답)을 제외한 유효 데이터만 추출
-        valid_asset_df = df.dropna(subset=['total_asset_amount']).copy()
-        
-        # [조건] 자산 10,000만 원(1억 원) 이하인 데이터만 포함
-        valid_asset_df = valid_asset_df[valid_asset_df['total_asset_amount'] <= 10000]
-        
-        # ---------------------------------------------------------------------
-        # (1) 취업 여부(outcome)에 따른 '평균 자산액' 비교
-        # ---------------------------------------------------------------------
-        # 이상치가 제거되었으므로 평균이 유의미합니다.
-        avg_asset_by_job = valid_asset_df.groupby('outcome', observed=False)['total_asset_amount'].mean().reset_index()
-        avg_asset_by_job['amount'] = avg_asset_by_job['total_asset_amount'].round(0) # 만원 단위
-
-        # ---------------------------------------------------------------------
-        # (2) 자산 규모(asset_group)에 따른 '취업 성공률' 비교
-        # ---------------------------------------------------------------------
-        # 구간 설정: 0원 / 500만원 미만 / 2000만원 미만 / 2000만원 이상
-        bins = [-1, 0, 500, 2000, float('inf')]
-        labels = ['자산 없음(0원)', '500만원 미만', '500~2,000만원', '2,000만원 이상']
-        
-        valid_asset_df['asset_group'] = pd.cut(valid_asset_df['total_asset_amount'], bins=bins, labels=labels)
-        
-        job_rate_by_asset_group = valid_asset_df.groupby('asset_group', observed=False)['got_job_flag'].mean().reset_index()
-        job_rate_by_asset_group['rate'] = (job_rate_by_asset_group['got_job_flag'] * 100).round(1)
-
-        # 2. 차트 그리기 (디자인 통일)
-        c1, c2 = st.columns(2)
-
-        # 색상 맵 정의 (Tab 4와 톤앤매너 유지)
-        OUTCOME_COLOR_MAP = {'취업 성공': '#29B6F6', '미취업': '#FF7043'} # 파랑(성공) / 주황(미취업)
-
-        with c1:
-            st.markdown("##### 1️⃣ 취업 상태별 평균 자산액")
-            fig_avg = px.bar(
-                avg_asset_by_job,
-                x="outcome",
-                y="amount",
-                color="outcome",
-                text_auto=',.0f', # 천단위 콤마
-                title="취업/미취업 그룹 평균 자산 (단위: 만원)",
-                labels={'outcome': '취업 상태', 'amount': '평균 자산(만원)'},
-                color_discrete_map=OUTCOME_COLOR_MAP
-            )
-
-            fig_avg.update_layout(title_font_color="white")
-
-            # 탭 4처럼 update_chart_design 적용
-            st.plotly_chart(update_chart_design(fig_avg), use_container_width=True)
-
-        with c2:
-            st.markdown("##### 2️⃣ 자산 규모별 취업 성공률")
-            fig_trend = px.bar(
-                job_rate_by_asset_group,
-                x="asset_group",
-                y="rate",
-                color="asset_group",
-                text_auto='.1f',
-                title="자산 구간별 취업 성공률 (%)",
-                labels={'asset_group': '금융자산 규모', 'rate': '취업 성공률(%)'},
-                # 자산 규모가 커질수록 진한 색상 (Sequential Blues)
-                color_discrete_sequence=px.colors.sequential.Blues
-            )
-            fig_trend.update_layout(yaxis_range=[0, 100], title_font_color="white") # Y축 100% 고정
-
-            # 탭 4처럼 update_chart_design 적용
-            st.plotly_chart(update_chart_design(fig_trend), use_container_width=True)
-
-        # 3. 인사이트 텍스트
-        try:
-            val_emp = avg_asset_by_job.loc[avg_asset_by_job['outcome']=='취업 성공', 'amount'].values[0]
-            val_unemp = avg_asset_by_job.loc[avg_asset_by_job['outcome']=='미취업', 'amount'].values[0]
-            diff = val_emp - val_unemp
-            comparison = "많습니다" if diff > 0 else "적습니다"
-            
-            # 자산 없음 vs 고자산 취업률 차이
-            rate_no_asset = job_rate_by_asset_group.loc[0, 'rate']
-            rate_high_asset = job_rate_by_asset_group.iloc[-1]['rate']
-
-            st.info(
-                f"💡 **분석 결과:** \n"
-                f"- **취업자 자산 우위:** 취업 성공 그룹의 평균 자산은 **{int(val_emp):,}만원**으로, "
-                f"미취업 그룹({int(val_unemp):,}만원)보다 약 **{abs(int(diff)):,}만원 {comparison}**.\n"
-                f"- **자산과 취업률:** 자산이 없는 그룹의 취업률(**{rate_no_asset}%**)보다 "
-                f"2,000만원 이상 자산 보유 그룹의 취업률(**{rate_high_asset}%**)이 더 높게 나타납니다."
-            )
-        except (IndexError, ValueError):
-            st.warning("데이터가 충분하지 않아 인사이트를 생성할 수 없습니다.")
-            
-    else:
-        st.error("⚠️ 'total_asset_amount' 데이터가 없습니다. data_preprocessing.py를 실행하여 데이터를 갱신해주세요.")
-# ==============================
-# 📌 TAB 6: 학력 및 지역
-# ==============================
-with tabs[5]:
-    st.subheader("🏫 학력과 거주지")
-    c1, c2 = st.columns(2)
-    with c1:
-        fig = px.histogram(df, x="edu_label", color="outcome", barmode="group",
-                           color_discrete_map=COLOR_MAP, title="학력별 분포")
-        fig.update_layout(title_font_color="white")
-
-        
-        st.plotly_chart(update_chart_design(fig), use_container_width=True)
-    with c2:
-        fig2 = px.histogram(df, y="region_label", color="outcome", barmode="stack", orientation='h',
-                            color_discrete_map=COLOR_MAP, title="지역별 분포")
-        fig2.update_layout(yaxis={'categoryorder':'total ascending'}, title_font_color="white")
-        st.plotly_chart(update_chart_design(fig2), use_container_width=True)
-
-# ==============================
-# 📌 TAB 7: 건강
-# ==============================
-with tabs[6]:
-    st.subheader("💪 건강 상태와 취업")
-    
-    health_counts = df.groupby(['health_label', 'outcome'], observed=False).size().reset_index(name='count')
-    health_total = df.groupby('health_label', observed=False).size().reset_index(name='total')
-    merged = health_counts.merge(health_total, on='health_label')
-    merged['ratio'] = merged['count'] / merged['total'] * 100
-    
-    fig = px.bar(merged, x="health_label", y="ratio", color="outcome", text_auto='.1f',
-                 color_discrete_map=COLOR_MAP, title="주관적 건강 상태별 취업률")
-    fig.update_layout(yaxis={'categoryorder':'total ascending'}, title_font_color="white")
-    st.plotly_chart(update_chart_design(fig), use_container_width=True)
\ No newline at end of file
+# -----------------------------------------------------------------------------
+# 5. 공유 결과 캐시 상태 (모든 세션 합계)
+# -----------------------------------------------------------------------------
+with st.sidebar.expander("⚙️ 캐시 상태"):
+    stats = get_result_cache().stats()
+    st.caption(
+        f"항목 {stats['entries']}/{stats['max_entries']} · TTL {stats['ttl_s']:.0f}s  \n"
+        f"hit {stats['hits']:,} · miss {stats['misses']:,} · 적중률 {stats['hit_rate'] * 100:.1f}%  \n"
+        f"eviction {stats['evictions']:,}"
+    )